@@ -6,6 +6,7 @@ from PySide6.QtWidgets import QApplication
 from typing import Optional
 
 _app: Optional[QApplication] = None
+_themes_ready = False
 
 
 def get_app() -> QApplication:
@@ -16,6 +17,40 @@ def get_app() -> QApplication:
     return _app
 
 
+def init_themes() -> None:
+    """
+    Create the default theme files, discover the themes and make sure the
+    current theme exists.
+    
+    Runs once per session. The config dialog (shown again after an invalid ID)
+    and run_gui() share the result; later changes in the themes folder are
+    picked up by the theme file watcher.
+    """
+    global _themes_ready
+    if _themes_ready:
+        return
+    from helpers.theme_helpers import (
+        create_default_theme_files, load_all_themes, get_available_themes,
+        get_current_theme, set_current_theme
+    )
+
+    try:
+        create_default_theme_files()
+        load_all_themes()
+    except Exception as e:
+        import logging
+        logging.error(f"Error loading themes: {e}")
+
+    themes = get_available_themes()
+    current = get_current_theme()
+    if not themes or current not in themes:
+        if themes:
+            set_current_theme(list(themes.keys())[0])
+        else:
+            set_current_theme("dark_theme")
+    _themes_ready = True
+
+
 def run_gui(main_module=None):
     """Run the main GUI (called from main.py). Creates app, shows main window, runs exec."""
     import sys
@@ -26,9 +61,7 @@ def run_gui(main_module=None):
     from .main_window import MainWindow
     from .thread_bridge import ThreadBridge
     from helpers.theme_helpers import (
-        load_theme_from_file, get_current_theme, apply_theme,
-        register_theme_applier, load_all_themes, create_default_theme_files,
-        get_available_themes, set_current_theme
+        load_theme_from_file, get_current_theme, register_theme_applier
     )
     from gui.theme_engine import apply_theme_to_app
 
@@ -40,21 +73,7 @@ def run_gui(main_module=None):
 
     register_theme_applier(_apply)
 
-    try:
-        create_default_theme_files()
-        load_all_themes()
-    except Exception as e:
-        import logging
-        logging.error(f"Error loading themes: {e}")
-
-    themes = get_available_themes()
-    current = get_current_theme()
-    if not themes or current not in themes:
-        if themes:
-            set_current_theme(list(themes.keys())[0])
-        else:
-            set_current_theme("dark_theme")
-
+    init_themes()
     _apply(get_current_theme())
 
     # Create thread bridge and main window
@@ -64,6 +83,7 @@ def run_gui(main_module=None):
 
     mw = MainWindow(bridge, main_module)
     main_module.GUI_MAIN_WINDOW_REF.append(mw)
+    main_module.gui_ready.set()  # Wake worker threads waiting for the GUI
 
     mw.show()
 
@@ -3,10 +3,11 @@
 # =============================================================================
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QFormLayout, QLineEdit, QSpinBox, QCheckBox,
-    QComboBox, QPushButton, QLabel, QHBoxLayout
+    QDialog, QVBoxLayout, QFormLayout, QLineEdit, QComboBox, QPushButton,
+    QLabel, QHBoxLayout
 )
 from PySide6.QtCore import Qt
+from .settings_window import add_setting_widgets, apply_setting_widgets
 
 
 def show_config_dialog(invalid_id: bool = False, not_live: bool = False) -> bool:
@@ -16,32 +17,12 @@ def show_config_dialog(invalid_id: bool = False, not_live: bool = False) -> bool
     Returns:
         True if user clicked "Save and Start", False if "Quit"
     """
-    from .app import get_app
+    from .app import get_app, init_themes
     from .theme_engine import apply_theme_to_app
-    from helpers.theme_helpers import (
-        create_default_theme_files, load_all_themes, get_theme_dropdown_items,
-        get_theme_name_from_display, set_current_theme, get_current_theme,
-        get_available_themes, load_theme_from_file
-    )
-    from settings import Settings
+    from helpers.theme_helpers import get_current_theme, load_theme_from_file
 
     app = get_app()
-
-    try:
-        create_default_theme_files()
-        load_all_themes()
-    except Exception as e:
-        import logging
-        logging.error(f"Error loading themes: {e}")
-
-    themes = get_available_themes()
-    current = get_current_theme()
-    if not themes or current not in themes:
-        if themes:
-            set_current_theme(list(themes.keys())[0])
-        else:
-            set_current_theme("dark_theme")
-
+    init_themes()
     apply_theme_to_app(app, get_current_theme(), load_theme_from_file)
 
     dialog = ConfigDialog(invalid_id, not_live)
@@ -76,59 +57,7 @@ class ConfigDialog(QDialog):
             lbl.setStyleSheet("color: #ff6464")
             form.addRow(lbl)
 
-        self.prefix_input = QLineEdit()
-        self.prefix_input.setText(Settings.PREFIX)
-        form.addRow("Command Prefix:", self.prefix_input)
-
-        self.queue_input = QLineEdit()
-        self.queue_input.setText(Settings.QUEUE_COMMAND)
-        form.addRow("Queue Command:", self.queue_input)
-
-        self.rate_limit_input = QSpinBox()
-        self.rate_limit_input.setRange(0, 999999)
-        self.rate_limit_input.setValue(Settings.RATE_LIMIT_SECONDS)
-        form.addRow("Rate Limit (seconds):", self.rate_limit_input)
-
-        self.toast_checkbox = QCheckBox("Enable Toast Notifications")
-        self.toast_checkbox.setChecked(Settings.TOAST_NOTIFICATIONS)
-        form.addRow(self.toast_checkbox)
-
-        self.allow_urls_checkbox = QCheckBox("Allow URL Requests")
-        self.allow_urls_checkbox.setChecked(Settings.ALLOW_URLS)
-        form.addRow(self.allow_urls_checkbox)
-
-        self.require_membership_checkbox = QCheckBox("Require Membership to request")
-        self.require_membership_checkbox.setChecked(Settings.REQUIRE_MEMBERSHIP)
-        form.addRow(self.require_membership_checkbox)
-
-        self.require_superchat_checkbox = QCheckBox("Require Superchat to request")
-        self.require_superchat_checkbox.setChecked(Settings.REQUIRE_SUPERCHAT)
-        form.addRow(self.require_superchat_checkbox)
-
-        self.minimum_superchat_input = QSpinBox()
-        self.minimum_superchat_input.setRange(0, 9999)
-        self.minimum_superchat_input.setValue(Settings.MINIMUM_SUPERCHAT)
-        form.addRow("Minimum Superchat (USD):", self.minimum_superchat_input)
-
-        self.enforce_user_whitelist_checkbox = QCheckBox("Enforce User Whitelist")
-        self.enforce_user_whitelist_checkbox.setChecked(Settings.ENFORCE_USER_WHITELIST)
-        form.addRow(self.enforce_user_whitelist_checkbox)
-
-        self.enforce_id_whitelist_checkbox = QCheckBox("Enforce Song Whitelist")
-        self.enforce_id_whitelist_checkbox.setChecked(Settings.ENFORCE_ID_WHITELIST)
-        form.addRow(self.enforce_id_whitelist_checkbox)
-
-        self.autoremove_checkbox = QCheckBox("Automatically remove songs")
-        self.autoremove_checkbox.setChecked(Settings.AUTOREMOVE_SONGS)
-        form.addRow(self.autoremove_checkbox)
-
-        self.song_finish_checkbox = QCheckBox("Notify When New Song Starts")
-        self.song_finish_checkbox.setChecked(Settings.SONG_FINISH_NOTIFICATIONS)
-        form.addRow(self.song_finish_checkbox)
-
-        self.autoban_checkbox = QCheckBox("Autoban users")
-        self.autoban_checkbox.setChecked(Settings.AUTOBAN_USERS)
-        form.addRow(self.autoban_checkbox)
+        add_setting_widgets(self, form)
 
         from helpers.theme_helpers import (
             get_theme_dropdown_items, get_available_themes, get_current_theme
@@ -161,19 +90,7 @@ class ConfigDialog(QDialog):
         from helpers.theme_helpers import get_theme_name_from_display, set_current_theme
 
         Settings.YOUTUBE_VIDEO_ID = self.id_input.text().strip()
-        Settings.PREFIX = self.prefix_input.text().strip()
-        Settings.QUEUE_COMMAND = self.queue_input.text().strip()
-        Settings.RATE_LIMIT_SECONDS = self.rate_limit_input.value()
-        Settings.TOAST_NOTIFICATIONS = self.toast_checkbox.isChecked()
-        Settings.ALLOW_URLS = self.allow_urls_checkbox.isChecked()
-        Settings.REQUIRE_MEMBERSHIP = self.require_membership_checkbox.isChecked()
-        Settings.REQUIRE_SUPERCHAT = self.require_superchat_checkbox.isChecked()
-        Settings.MINIMUM_SUPERCHAT = self.minimum_superchat_input.value()
-        Settings.ENFORCE_USER_WHITELIST = self.enforce_user_whitelist_checkbox.isChecked()
-        Settings.ENFORCE_ID_WHITELIST = self.enforce_id_whitelist_checkbox.isChecked()
-        Settings.AUTOREMOVE_SONGS = self.autoremove_checkbox.isChecked()
-        Settings.SONG_FINISH_NOTIFICATIONS = self.song_finish_checkbox.isChecked()
-        Settings.AUTOBAN_USERS = self.autoban_checkbox.isChecked()
+        apply_setting_widgets(self)
 
         display = self.theme_combo.currentText()
         if display:
@@ -182,7 +99,7 @@ class ConfigDialog(QDialog):
                 Settings.THEME = theme_name
                 set_current_theme(theme_name)
 
-        Settings.save()
+        Settings.schedule_save()
         self.accept()
 
     def _quit(self):
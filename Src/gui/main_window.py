@@ -3,36 +3,80 @@
 # =============================================================================
 
 import logging
+import threading
 import webbrowser
+from time import monotonic
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QSlider, QPlainTextEdit, QMenuBar,
     QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
+
+CONSOLE_MAX_LINES = 100   # Lines kept in the console widget
+GUI_FLUSH_MS = 16         # Worker updates are coalesced and applied at most once per frame
+THEME_RELOAD_DELAY_MS = 500  # Themes reload once the theme files have been quiet this long
 
 
 class GuiLogger(logging.Handler):
-    """Logging handler that appends to the console via signal (thread-safe)."""
+    """
+    Logging handler that buffers lines for the console (thread-safe).
+
+    Lines are collected under a lock and the GUI is signalled only when a new
+    batch starts, so a burst of log records costs one cross-thread signal;
+    the GUI thread picks the whole batch up with take_lines(). The handler is
+    created by MainWindow once the console exists, so emit() needs no
+    readiness checks.
+    """
 
     def __init__(self, bridge):
         super().__init__()
         self.bridge = bridge
+        self._format = self.format
+        self._pending = []
+        self._pending_lock = threading.Lock()
+
+    def setFormatter(self, fmt):
+        super().setFormatter(fmt)
+        # Bind the formatter directly so emit() skips Handler.format's indirection
+        self._format = fmt.format if fmt else self.format
+
+    def handle(self, record):
+        # Same as Handler.handle() minus the handler lock: emit() only shares
+        # _pending, which has its own lock, so records need no second one
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
 
     def emit(self, record):
         try:
-            msg = self.format(record)
-            if self.bridge:
-                self.bridge.set_console_text.emit(msg)
+            msg = self._format(record)
+            with self._pending_lock:
+                self._pending.append(msg)
+                first = len(self._pending) == 1
+            if first:
+                self.bridge.console_lines_ready.emit()
         except Exception:
             pass
 
+    def take_lines(self) -> list:
+        """Return and clear the lines logged since the last call (GUI thread)."""
+        with self._pending_lock:
+            lines, self._pending = self._pending, []
+        return lines
+
 
 class MainWindow(QMainWindow):
     def __init__(self, bridge, main_module):
         super().__init__()
         self.bridge = bridge
         self.main = main_module
+        # Management dialogs are built on first open and reused afterwards
+        self._moderation_windows = {}
+        self._queue_history_window = None
         self.setWindowTitle("LYTE Control Panel")
         self.setMinimumSize(700, 380)
         self.resize(1330, 750)
@@ -57,7 +101,7 @@ class MainWindow(QMainWindow):
         # Playback controls
         ctrl_layout = QHBoxLayout()
         self.play_btn = QPushButton("Play / Pause")
-        self.play_btn.clicked.connect(lambda: self.main.player.pause())
+        self.play_btn.clicked.connect(self._on_play_pause)
         self.play_btn.setToolTip("Play/Pause the current song")
         ctrl_layout.addWidget(self.play_btn)
 
@@ -108,22 +152,45 @@ class MainWindow(QMainWindow):
         self.console.setReadOnly(True)
         self.console.setMinimumHeight(200)
         self.console.setToolTip("Log messages and application status")
+        # The widget drops the oldest lines itself, so appending never rebuilds the history
+        self.console.setMaximumBlockCount(CONSOLE_MAX_LINES)
         layout.addWidget(self.console)
 
+        # Latest value per widget from worker signals, applied once per frame
+        self._pending_updates = {}
+        self._update_appliers = {
+            "now_playing": self.now_playing_label.setText,
+            "time_text": self.song_time_label.setText,
+            "slider": self._apply_slider,
+            "console": self._apply_console,
+        }
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(GUI_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_updates)
+
+        # Trailing-edge debounce for theme file changes: every change restarts the
+        # timer, so an editor's burst of events for one save reloads once, after
+        # the last event (which also gives Windows time to finish the write)
+        self._theme_reload_timer = QTimer(self)
+        self._theme_reload_timer.setSingleShot(True)
+        self._theme_reload_timer.setInterval(THEME_RELOAD_DELAY_MS)
+        self._theme_reload_timer.timeout.connect(self._reload_themes_from_watcher)
+
         # Set up GUI logger (uses signal for thread-safe updates)
-        gui_handler = GuiLogger(bridge)
-        gui_handler.setLevel(logging.INFO)
-        gui_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        logging.getLogger().addHandler(gui_handler)
+        self._gui_handler = GuiLogger(bridge)
+        self._gui_handler.setLevel(logging.INFO)
+        self._gui_handler.setFormatter(self.main.log_formatter)
+        logging.getLogger().addHandler(self._gui_handler)
 
         # Connect bridge signals
         bridge.update_now_playing.connect(self._on_update_now_playing)
         bridge.update_slider.connect(self._on_update_slider)
-        bridge.update_time_text.connect(self.song_time_label.setText)
+        bridge.update_time_text.connect(self._on_update_time_text)
         bridge.refresh_list.connect(self._on_refresh_list)
         bridge.show_download_ui.connect(self._on_show_download_ui)
         bridge.hide_update_ui.connect(self._on_hide_update_ui)
-        bridge.set_console_text.connect(self._on_append_console)
+        bridge.console_lines_ready.connect(self._on_console_lines_ready)
         bridge.request_theme_reload.connect(
             self._on_request_theme_reload,
             Qt.ConnectionType.QueuedConnection
@@ -140,26 +207,41 @@ class MainWindow(QMainWindow):
         self.main.update_now_playing()
 
     def _on_volume(self, value):
-        self.main.Settings.VOLUME = value
-        if self.main.player.get_media_player():
-            self.main.player.get_media_player().audio_set_volume(value)
-        self.main.save_config_to_file()
+        self.main.on_volume_change(value)
 
     def _on_song_slider(self, value):
         length = self.main.get_song_length()
         if length:
             pos_ms = int((value / 1000.0) * length * 1000)
-            self.main.player.get_media_player().set_time(pos_ms)
-            self.main.last_user_seek_time = self.main.current_time()
+            self.main.media_player.set_time(pos_ms)
+            self.main.last_user_seek_time = monotonic()
+
+    def _queue_update(self, key: str, value):
+        """Record the latest value for a widget; it is applied on the next flush."""
+        self._pending_updates[key] = value
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_updates(self):
+        """Apply all pending widget updates in one pass."""
+        pending, self._pending_updates = self._pending_updates, {}
+        for key, value in pending.items():
+            self._update_appliers[key](value)
 
     def _on_update_slider(self, progress: float):
+        self._queue_update("slider", progress)
+
+    def _apply_slider(self, progress: float):
         if not self._ignore_slider:
             self._ignore_slider = True
             self.song_slider.setValue(int(progress * 1000))
             self._ignore_slider = False
 
+    def _on_update_time_text(self, text: str):
+        self._queue_update("time_text", text)
+
     def _on_update_now_playing(self, text: str):
-        self.now_playing_label.setText(text)
+        self._queue_update("now_playing", text)
 
     def _on_refresh_list(self, list_id: str, items: list):
         # Handled by modal windows - they connect to refresh_list with their list_id
@@ -174,18 +256,22 @@ class MainWindow(QMainWindow):
     def _on_hide_update_ui(self):
         self.update_label.hide()
 
-    def _on_append_console(self, msg: str):
-        """Thread-safe: append log line to console (slot runs on GUI thread)."""
-        cur = self.console.toPlainText()
-        lines = cur.splitlines()
-        lines.append(msg)
-        if len(lines) > 100:
-            lines = lines[-100:]
-        self.console.setPlainText("\n".join(lines))
+    def _on_console_lines_ready(self):
+        """GuiLogger has new lines; they are appended on the next flush."""
+        self._queue_update("console", None)
+
+    def _apply_console(self, _=None):
+        """Append the lines logged since the last flush in one update."""
+        lines = self._gui_handler.take_lines()
+        if lines:
+            # Older lines in a large burst would be trimmed by the block limit anyway
+            self.console.appendPlainText("\n".join(lines[-CONSOLE_MAX_LINES:]))
 
     def _on_request_theme_reload(self):
-        """Theme file changed; reload themes on GUI thread."""
-        logging.info("Theme file change detected, reloading...")
+        """Theme file changed; (re)start the reload timer."""
+        self._theme_reload_timer.start()
+
+    def _reload_themes_from_watcher(self):
         self._do_reload_themes()
         logging.info("Themes reloaded automatically")
 
@@ -196,16 +282,23 @@ class MainWindow(QMainWindow):
 
     def _rebuild_theme_menu(self):
         """Rebuild View → Theme submenu with current themes (for live reload)."""
+        current_theme = self.main.get_current_theme()
+        # Dropdown items follow the theme dict's order; each action carries its
+        # theme name so selecting it needs no display-name lookup
+        display_names = self.main.get_theme_dropdown_items()
+        entries = list(zip(self.main.get_available_themes(), display_names))
+        if entries == self._theme_menu_entries:
+            # Same themes as last time (e.g. only colors changed): just fix the checkmark
+            for action in self.theme_menu.actions():
+                action.setChecked(action.data() == current_theme)
+            return
+        self._theme_menu_entries = entries
         self.theme_menu.clear()
-        current_display = self.main.get_available_themes().get(
-            self.main.get_current_theme(), {}
-        ).get("display_name", "")
-        for display_name in self.main.get_theme_dropdown_items():
-            action = self.theme_menu.addAction(
-                display_name, lambda dn=display_name: self._select_theme(dn)
-            )
+        for theme_name, display_name in entries:
+            action = self.theme_menu.addAction(display_name)
+            action.setData(theme_name)
             action.setCheckable(True)
-            action.setChecked(display_name == current_display)
+            action.setChecked(theme_name == current_theme)
 
     def _create_menu(self):
         menubar = self.menuBar()
@@ -219,21 +312,21 @@ class MainWindow(QMainWindow):
         # View
         view_menu = menubar.addMenu("View")
         self.theme_menu = view_menu.addMenu("Theme")
-        for display_name in self.main.get_theme_dropdown_items():
-            action = self.theme_menu.addAction(display_name, lambda dn=display_name: self._select_theme(dn))
-            action.setCheckable(True)
-            if display_name == self.main.get_available_themes().get(self.main.get_current_theme(), {}).get("display_name", ""):
-                action.setChecked(True)
-        view_menu.addAction("Open Themes Folder", lambda: self.main.show_folder(self.main.THEMES_FOLDER))
+        self._theme_menu_entries = None  # (theme name, display name) pairs currently in the menu
+        # One handler for the whole submenu instead of a closure per theme action
+        self.theme_menu.triggered.connect(self._on_theme_action)
+        self._rebuild_theme_menu()
+        view_menu.addAction("Open Themes Folder", self._open_themes_folder)
         view_menu.addAction("Reload themes", self._do_reload_themes)
 
-        # Moderation
+        # Moderation: one action per MODERATION_WINDOW_SPECS entry, tagged with its
+        # list ID and served by a single handler
+        from .moderation_windows import MODERATION_WINDOW_SPECS
         mod_menu = menubar.addMenu("Moderation")
         mod_menu.addAction("View Queue History", self._show_queue_history)
-        mod_menu.addAction("Manage Banned Users", self._show_banned_users)
-        mod_menu.addAction("Manage Banned Videos", self._show_banned_videos)
-        mod_menu.addAction("Manage Whitelisted Users", self._show_whitelisted_users)
-        mod_menu.addAction("Manage Whitelisted Videos", self._show_whitelisted_videos)
+        for list_id, spec in MODERATION_WINDOW_SPECS.items():
+            mod_menu.addAction(f"Manage {spec['title']}").setData(list_id)
+        mod_menu.triggered.connect(self._on_moderation_action)
 
         # Help
         help_menu = menubar.addMenu("Help")
@@ -242,19 +335,33 @@ class MainWindow(QMainWindow):
         help_menu.addAction("Check for Updates", self.main.check_for_updates_wrapper)
         self.update_details_action = help_menu.addAction("View Update Details...", self._show_update_details)
         self.update_details_action.setEnabled(False)
-        help_menu.addAction("Open GitHub Issues", lambda: webbrowser.open("https://github.com/StroepWafel/LYTE/issues"))
-        help_menu.addAction("Open General Documentation", lambda: webbrowser.open("https://www.stroepwafel.au/LYTE/documentation"))
-        help_menu.addAction("Open Theme Documentation", lambda: webbrowser.open("https://www.stroepwafel.au/LYTE/documentation/theme-documentation"))
+        help_menu.addAction("Open GitHub Issues", self._open_github_issues)
+        help_menu.addAction("Open General Documentation", self._open_documentation)
+        help_menu.addAction("Open Theme Documentation", self._open_theme_documentation)
+
+    def _on_play_pause(self):
+        self.main.player.pause()
 
-    def _select_theme(self, display_name: str):
-        theme_name = self.main.get_theme_name_from_display(display_name)
-        self.main.select_theme_by_name(theme_name)
+    def _open_themes_folder(self):
+        self.main.show_folder(self.main.THEMES_FOLDER)
+
+    def _open_github_issues(self):
+        webbrowser.open("https://github.com/StroepWafel/LYTE/issues")
+
+    def _open_documentation(self):
+        webbrowser.open("https://www.stroepwafel.au/LYTE/documentation")
+
+    def _open_theme_documentation(self):
+        webbrowser.open("https://www.stroepwafel.au/LYTE/documentation/theme-documentation")
+
+    def _on_theme_action(self, action):
+        self.main.select_theme_by_name(action.data())
         for a in self.theme_menu.actions():
             if a.isCheckable():
-                a.setChecked(a.text() == display_name)
+                a.setChecked(a.data() == action.data())
 
     def _reload_config(self):
-        self.main.load_config()
+        self.main.load_config(force=True)
 
     def _show_settings(self):
         from .settings_window import SettingsWindow
@@ -264,37 +371,25 @@ class MainWindow(QMainWindow):
 
     def _show_queue_history(self):
         from .moderation_windows import QueueHistoryWindow
-        self.main.refresh_queue_history_list()
-        dlg = QueueHistoryWindow(self.main)
-        dlg.exec()
-
-    def _show_banned_users(self):
-        from .moderation_windows import BannedUsersWindow
-        self.main.load_banned_users_wrapper()
-        self.main.refresh_banned_users_list()
-        dlg = BannedUsersWindow(self.main)
-        dlg.exec()
-
-    def _show_banned_videos(self):
-        from .moderation_windows import BannedVideosWindow
-        self.main.load_banned_ids_wrapper()
-        self.main.refresh_banned_ids_list()
-        dlg = BannedVideosWindow(self.main)
+        if self._queue_history_window is None:
+            self._queue_history_window = QueueHistoryWindow(self.main)
+        else:
+            self._queue_history_window._refresh_list()
+        self._queue_history_window.exec()
+
+    def _show_moderation_list(self, list_id: str):
+        from .moderation_windows import ModerationListWindow
+        dlg = self._moderation_windows.get(list_id)
+        if dlg is None:
+            dlg = self._moderation_windows[list_id] = ModerationListWindow(self.main, list_id)
+        else:
+            dlg.refresh_if_stale()
         dlg.exec()
 
-    def _show_whitelisted_users(self):
-        from .moderation_windows import WhitelistedUsersWindow
-        self.main.load_whitelisted_users_wrapper()
-        self.main.refresh_whitelisted_users_list()
-        dlg = WhitelistedUsersWindow(self.main)
-        dlg.exec()
-
-    def _show_whitelisted_videos(self):
-        from .moderation_windows import WhitelistedVideosWindow
-        self.main.load_whitelisted_ids_wrapper()
-        self.main.refresh_whitelisted_ids_list()
-        dlg = WhitelistedVideosWindow(self.main)
-        dlg.exec()
+    def _on_moderation_action(self, action):
+        list_id = action.data()
+        if list_id:  # "View Queue History" has no list ID and its own slot
+            self._show_moderation_list(list_id)
 
     def _show_update_details(self):
         from .update_window import UpdateDetailsWindow
@@ -3,305 +3,194 @@
 # =============================================================================
 
 import logging
-import threading
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QListWidget, QLineEdit, QPushButton,
+    QDialog, QVBoxLayout, QListWidget, QListWidgetItem, QLineEdit, QPushButton,
     QHBoxLayout, QLabel
 )
+from PySide6.QtCore import Qt
 from helpers.moderation_helpers import (
-    save_banned_users, save_banned_ids, save_whitelisted_users, save_whitelisted_ids
+    ModerationEntry, add_entry, rename_entry, remove_entry, has_entry,
+    BANNED_USERS_TABLE, BANNED_IDS_TABLE, WHITELISTED_USERS_TABLE, WHITELISTED_IDS_TABLE
 )
-from helpers.youtube_helpers import fetch_channel_name, get_video_name_fromID
-
-
-def _extract_id(s: str) -> str:
-    """Extract ID from 'Name (ID)' format."""
-    return s.split("(")[-1].strip(")")
-
-
-def _add_with_async_fetch(item_id: str, item_list: list, save_func, refresh_callback, fetch_name_func):
-    """refresh_callback should be thread-safe (e.g. emit a Qt signal)."""
-    if not item_id or any(u["id"] == item_id for u in item_list):
+from helpers.youtube_helpers import fetch_channel_name, get_video_name_fromID, name_fetch_pool
+
+
+def _populate_list(list_widget: QListWidget, entries: dict) -> None:
+    """Fill a list widget with entries (ID -> ModerationEntry), storing each ID on its item."""
+    list_widget.clear()
+    # Iterate a snapshot: the chat thread can add entries (auto-ban) meanwhile
+    for entry in list(entries.values()):
+        item = QListWidgetItem(entry.display)
+        item.setData(Qt.ItemDataRole.UserRole, entry.id)
+        list_widget.addItem(item)
+
+
+def _set_list_item(list_widget: QListWidget, item_id: str, text: str) -> None:
+    """Update the row for item_id in place, or append it if it is not shown yet."""
+    for row in range(list_widget.count()):
+        item = list_widget.item(row)
+        if item.data(Qt.ItemDataRole.UserRole) == item_id:
+            item.setText(text)
+            return
+    item = QListWidgetItem(text)
+    item.setData(Qt.ItemDataRole.UserRole, item_id)
+    list_widget.addItem(item)
+
+
+def _add_with_async_fetch(item_id: str, entries: dict, table: str, update_callback, fetch_name_func):
+    """
+    Add an entry with a placeholder name and fetch the real name in the background.
+
+    update_callback(item_id, display_text) is called once for the placeholder and
+    again from name_fetch_pool, so it must be thread-safe (e.g. emit a Qt signal).
+    """
+    if not item_id or has_entry(table, item_id):
         return
-    item_list.append({"id": item_id, "name": "Loading..."})
-    save_func(item_list)
-    refresh_callback()
+    entry = ModerationEntry(item_id, "Loading...")
+    entries[item_id] = entry
+    add_entry(table, item_id, entry.name)
+    update_callback(item_id, entry.display)
 
     def fetch():
         try:
             name = fetch_name_func(item_id)
-            for u in item_list:
-                if u["id"] == item_id:
-                    u["name"] = name
-                    break
-            save_func(item_list)
-            refresh_callback()  # Runs in worker thread - callback must emit signal for GUI update
+            # Skip if the entry was removed while the name was being fetched; rename_entry
+            # only updates an existing row, so a removal racing this write is not undone
+            if entries.get(item_id) is entry and rename_entry(table, item_id, name):
+                entry.name = name
+                update_callback(item_id, entry.display)
         except Exception as e:
             logging.error(f"Error fetching name: {e}")
 
-    threading.Thread(target=fetch, daemon=True).start()
-
-
-class BannedUsersWindow(QDialog):
-    def __init__(self, main):
+    name_fetch_pool.submit(fetch)
+
+
+# List ID -> window definition for the four "Manage ..." moderation windows
+MODERATION_WINDOW_SPECS = {
+    "banned_users_list": {
+        "title": "Banned Users",
+        "list_attr": "BANNED_USERS",
+        "table": BANNED_USERS_TABLE,
+        "placeholder": "Add User ID",
+        "add_label": "Ban User",
+        "remove_label": "Unban Selected",
+        "fetch_name": fetch_channel_name,
+    },
+    "banned_ids_list": {
+        "title": "Banned Videos",
+        "list_attr": "BANNED_IDS",
+        "table": BANNED_IDS_TABLE,
+        "placeholder": "Add Video ID",
+        "add_label": "Ban Video",
+        "remove_label": "Unban Selected",
+        "fetch_name": get_video_name_fromID,
+    },
+    "whitelisted_users_list": {
+        "title": "Whitelisted Users",
+        "list_attr": "WHITELISTED_USERS",
+        "table": WHITELISTED_USERS_TABLE,
+        "placeholder": "Add User ID",
+        "add_label": "Whitelist User",
+        "remove_label": "Un-Whitelist Selected",
+        "fetch_name": fetch_channel_name,
+    },
+    "whitelisted_ids_list": {
+        "title": "Whitelisted Videos",
+        "list_attr": "WHITELISTED_IDS",
+        "table": WHITELISTED_IDS_TABLE,
+        "placeholder": "Add Video ID",
+        "add_label": "Whitelist Video",
+        "remove_label": "Un-Whitelist Selected",
+        "fetch_name": get_video_name_fromID,
+    },
+}
+
+
+class ModerationListWindow(QDialog):
+    """Manage one ban/whitelist list, as described by MODERATION_WINDOW_SPECS[list_id]."""
+
+    def __init__(self, main, list_id: str):
         super().__init__(main.GUI_MAIN_WINDOW_REF[0] if main.GUI_MAIN_WINDOW_REF else None)
         self.main = main
-        self.setWindowTitle("Banned Users")
+        self.list_id = list_id
+        self.spec = MODERATION_WINDOW_SPECS[list_id]
+        self.setWindowTitle(self.spec["title"])
         self.setMinimumSize(400, 400)
 
         layout = QVBoxLayout(self)
-        layout.addWidget(QLabel("Manage Banned Users"))
+        layout.addWidget(QLabel(f"Manage {self.spec['title']}"))
 
         self.list_widget = QListWidget()
         self._refresh_list()
         layout.addWidget(self.list_widget)
 
         self.input = QLineEdit()
-        self.input.setPlaceholderText("Add User ID")
+        self.input.setPlaceholderText(self.spec["placeholder"])
         layout.addWidget(self.input)
 
         btn_layout = QHBoxLayout()
-        add_btn = QPushButton("Ban User")
-        add_btn.clicked.connect(self._ban)
-        un_btn = QPushButton("Unban Selected")
-        un_btn.clicked.connect(self._unban)
+        add_btn = QPushButton(self.spec["add_label"])
+        add_btn.clicked.connect(self._add)
+        remove_btn = QPushButton(self.spec["remove_label"])
+        remove_btn.clicked.connect(self._remove)
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(self.accept)
         btn_layout.addWidget(add_btn)
-        btn_layout.addWidget(un_btn)
+        btn_layout.addWidget(remove_btn)
         btn_layout.addWidget(close_btn)
         layout.addLayout(btn_layout)
 
         if hasattr(self.main, 'GUI_BRIDGE') and self.main.GUI_BRIDGE:
             self.main.GUI_BRIDGE.refresh_list.connect(self._on_refresh_signal)
+            self.main.GUI_BRIDGE.update_list_item.connect(self._on_item_signal)
 
-    def _on_refresh_signal(self, list_id: str, items: list):
-        if list_id == "banned_users_list":
-            self.list_widget.clear()
-            self.list_widget.addItems(items)
-
-    def _refresh_list(self):
-        items = [f"{u['name']} ({u['id']})" for u in self.main.BANNED_USERS]
-        self.list_widget.clear()
-        self.list_widget.addItems(items)
-
-    def _emit_refresh(self):
-        """Thread-safe refresh - emits signal for GUI update."""
-        if hasattr(self.main, 'GUI_BRIDGE') and self.main.GUI_BRIDGE:
-            self.main.GUI_BRIDGE.refresh_list.emit("banned_users_list", [f"{u['name']} ({u['id']})" for u in self.main.BANNED_USERS])
-
-    def _ban(self):
-        uid = self.input.text().strip()
-        _add_with_async_fetch(
-            uid, self.main.BANNED_USERS,
-            lambda lst: save_banned_users(lst, self.main.BANNED_USERS_PATH),
-            self._emit_refresh,
-            fetch_channel_name
-        )
-        self.input.clear()
-
-    def _unban(self):
-        item = self.list_widget.currentItem()
-        if item:
-            uid = _extract_id(item.text())
-            self.main.BANNED_USERS[:] = [u for u in self.main.BANNED_USERS if u["id"] != uid]
-            save_banned_users(self.main.BANNED_USERS, self.main.BANNED_USERS_PATH)
-            self._refresh_list()
-
-
-class BannedVideosWindow(QDialog):
-    def __init__(self, main):
-        super().__init__(main.GUI_MAIN_WINDOW_REF[0] if main.GUI_MAIN_WINDOW_REF else None)
-        self.main = main
-        self.setWindowTitle("Banned Videos")
-        self.setMinimumSize(400, 400)
-
-        layout = QVBoxLayout(self)
-        layout.addWidget(QLabel("Manage Banned Videos"))
-
-        self.list_widget = QListWidget()
-        self._refresh_list()
-        layout.addWidget(self.list_widget)
-
-        self.input = QLineEdit()
-        self.input.setPlaceholderText("Add Video ID")
-        layout.addWidget(self.input)
-
-        btn_layout = QHBoxLayout()
-        add_btn = QPushButton("Ban Video")
-        add_btn.clicked.connect(self._ban)
-        un_btn = QPushButton("Unban Selected")
-        un_btn.clicked.connect(self._unban)
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        btn_layout.addWidget(add_btn)
-        btn_layout.addWidget(un_btn)
-        btn_layout.addWidget(close_btn)
-        layout.addLayout(btn_layout)
-
-        if hasattr(self.main, 'GUI_BRIDGE') and self.main.GUI_BRIDGE:
-            self.main.GUI_BRIDGE.refresh_list.connect(self._on_refresh_signal)
+    @property
+    def _entries(self) -> dict:
+        return getattr(self.main, self.spec["list_attr"])
 
     def _on_refresh_signal(self, list_id: str, items: list):
-        if list_id == "banned_ids_list":
-            self.list_widget.clear()
-            self.list_widget.addItems(items)
-
-    def _refresh_list(self):
-        self.list_widget.clear()
-        self.list_widget.addItems([f"{u['name']} ({u['id']})" for u in self.main.BANNED_IDS])
-
-    def _emit_refresh(self):
-        if hasattr(self.main, 'GUI_BRIDGE') and self.main.GUI_BRIDGE:
-            self.main.GUI_BRIDGE.refresh_list.emit("banned_ids_list", [f"{u['name']} ({u['id']})" for u in self.main.BANNED_IDS])
-
-    def _ban(self):
-        vid = self.input.text().strip()
-        _add_with_async_fetch(
-            vid, self.main.BANNED_IDS,
-            lambda lst: save_banned_ids(lst, self.main.BANNED_IDS_PATH),
-            self._emit_refresh,
-            get_video_name_fromID
-        )
-        self.input.clear()
-
-    def _unban(self):
-        item = self.list_widget.currentItem()
-        if item:
-            vid = _extract_id(item.text())
-            self.main.BANNED_IDS[:] = [u for u in self.main.BANNED_IDS if u["id"] != vid]
-            save_banned_ids(self.main.BANNED_IDS, self.main.BANNED_IDS_PATH)
+        if list_id == self.list_id:
             self._refresh_list()
 
-
-class WhitelistedUsersWindow(QDialog):
-    def __init__(self, main):
-        super().__init__(main.GUI_MAIN_WINDOW_REF[0] if main.GUI_MAIN_WINDOW_REF else None)
-        self.main = main
-        self.setWindowTitle("Whitelisted Users")
-        self.setMinimumSize(400, 400)
-
-        layout = QVBoxLayout(self)
-        layout.addWidget(QLabel("Manage Whitelisted Users"))
-
-        self.list_widget = QListWidget()
-        self._refresh_list()
-        layout.addWidget(self.list_widget)
-
-        self.input = QLineEdit()
-        self.input.setPlaceholderText("Add User ID")
-        layout.addWidget(self.input)
-
-        btn_layout = QHBoxLayout()
-        add_btn = QPushButton("Whitelist User")
-        add_btn.clicked.connect(self._add)
-        un_btn = QPushButton("Un-Whitelist Selected")
-        un_btn.clicked.connect(self._remove)
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        btn_layout.addWidget(add_btn)
-        btn_layout.addWidget(un_btn)
-        btn_layout.addWidget(close_btn)
-        layout.addLayout(btn_layout)
-
-        if hasattr(self.main, 'GUI_BRIDGE') and self.main.GUI_BRIDGE:
-            self.main.GUI_BRIDGE.refresh_list.connect(self._on_refresh_signal)
-
-    def _on_refresh_signal(self, list_id: str, items: list):
-        if list_id == "whitelisted_users_list":
-            self.list_widget.clear()
-            self.list_widget.addItems(items)
+    def _on_item_signal(self, list_id: str, item_id: str, text: str):
+        if list_id == self.list_id:
+            _set_list_item(self.list_widget, item_id, text)
 
     def _refresh_list(self):
-        self.list_widget.clear()
-        self.list_widget.addItems([f"{u['name']} ({u['id']})" for u in self.main.WHITELISTED_USERS])
-
-    def _emit_refresh(self):
-        if hasattr(self.main, 'GUI_BRIDGE') and self.main.GUI_BRIDGE:
-            self.main.GUI_BRIDGE.refresh_list.emit("whitelisted_users_list", [f"{u['name']} ({u['id']})" for u in self.main.WHITELISTED_USERS])
+        _populate_list(self.list_widget, self._entries)
+        self._shown_version = self.main.moderation_lists_version
 
-    def _add(self):
-        uid = self.input.text().strip()
-        _add_with_async_fetch(
-            uid, self.main.WHITELISTED_USERS,
-            lambda lst: save_whitelisted_users(lst, self.main.WHITELISTED_USERS_PATH),
-            self._emit_refresh,
-            fetch_channel_name
-        )
-        self.input.clear()
+    def refresh_if_stale(self):
+        """Rebuild the rows only if a reload changed the lists since they were shown.
 
-    def _remove(self):
-        item = self.list_widget.currentItem()
-        if item:
-            uid = _extract_id(item.text())
-            self.main.WHITELISTED_USERS[:] = [u for u in self.main.WHITELISTED_USERS if u["id"] != uid]
-            save_whitelisted_users(self.main.WHITELISTED_USERS, self.main.WHITELISTED_USERS_PATH)
+        Changes made through this window or show_list_entry() already update
+        the rows in place, so reopening the window usually costs nothing.
+        """
+        if self._shown_version != self.main.moderation_lists_version:
             self._refresh_list()
 
-
-class WhitelistedVideosWindow(QDialog):
-    def __init__(self, main):
-        super().__init__(main.GUI_MAIN_WINDOW_REF[0] if main.GUI_MAIN_WINDOW_REF else None)
-        self.main = main
-        self.setWindowTitle("Whitelisted Videos")
-        self.setMinimumSize(400, 400)
-
-        layout = QVBoxLayout(self)
-        layout.addWidget(QLabel("Manage Whitelisted Videos"))
-
-        self.list_widget = QListWidget()
-        self._refresh_list()
-        layout.addWidget(self.list_widget)
-
-        self.input = QLineEdit()
-        self.input.setPlaceholderText("Add Video ID")
-        layout.addWidget(self.input)
-
-        btn_layout = QHBoxLayout()
-        add_btn = QPushButton("Whitelist Video")
-        add_btn.clicked.connect(self._add)
-        un_btn = QPushButton("Un-Whitelist Selected")
-        un_btn.clicked.connect(self._remove)
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        btn_layout.addWidget(add_btn)
-        btn_layout.addWidget(un_btn)
-        btn_layout.addWidget(close_btn)
-        layout.addLayout(btn_layout)
-
-        if hasattr(self.main, 'GUI_BRIDGE') and self.main.GUI_BRIDGE:
-            self.main.GUI_BRIDGE.refresh_list.connect(self._on_refresh_signal)
-
-    def _on_refresh_signal(self, list_id: str, items: list):
-        if list_id == "whitelisted_ids_list":
-            self.list_widget.clear()
-            self.list_widget.addItems(items)
-
-    def _refresh_list(self):
-        self.list_widget.clear()
-        self.list_widget.addItems([f"{u['name']} ({u['id']})" for u in self.main.WHITELISTED_IDS])
-
-    def _emit_refresh(self):
+    def _emit_item_update(self, item_id: str, text: str):
+        """Thread-safe row update - emits signal for GUI update."""
         if hasattr(self.main, 'GUI_BRIDGE') and self.main.GUI_BRIDGE:
-            self.main.GUI_BRIDGE.refresh_list.emit("whitelisted_ids_list", [f"{u['name']} ({u['id']})" for u in self.main.WHITELISTED_IDS])
+            self.main.GUI_BRIDGE.update_list_item.emit(self.list_id, item_id, text)
 
     def _add(self):
-        vid = self.input.text().strip()
+        item_id = self.input.text().strip()
         _add_with_async_fetch(
-            vid, self.main.WHITELISTED_IDS,
-            lambda lst: save_whitelisted_ids(lst, self.main.WHITELISTED_IDS_PATH),
-            self._emit_refresh,
-            get_video_name_fromID
+            item_id, self._entries,
+            self.spec["table"],
+            self._emit_item_update,
+            self.spec["fetch_name"]
         )
         self.input.clear()
 
     def _remove(self):
         item = self.list_widget.currentItem()
         if item:
-            vid = _extract_id(item.text())
-            self.main.WHITELISTED_IDS[:] = [u for u in self.main.WHITELISTED_IDS if u["id"] != vid]
-            save_whitelisted_ids(self.main.WHITELISTED_IDS, self.main.WHITELISTED_IDS_PATH)
-            self._refresh_list()
+            item_id = item.data(Qt.ItemDataRole.UserRole)
+            self._entries.pop(item_id, None)
+            remove_entry(self.spec["table"], item_id)
+            self.list_widget.takeItem(self.list_widget.row(item))
 
 
 class QueueHistoryWindow(QDialog):
@@ -336,31 +225,31 @@ class QueueHistoryWindow(QDialog):
 
     def _on_refresh_signal(self, list_id: str, items: list):
         if list_id == "queue_history_list":
-            self.list_widget.clear()
-            self.list_widget.addItems(items)
+            self._refresh_list()
 
     def _refresh_list(self):
+        """Show QUEUE_HISTORY, storing each history entry on its item so nothing is parsed back from the label."""
         self.list_widget.clear()
-        items = [
-            f"{e['song_title']} - Requested by {e['username']} ({e['user_id']}) [{e['song_id']}]"
-            for e in self.main.QUEUE_HISTORY
-        ]
-        self.list_widget.addItems(items)
+        for entry in self.main.QUEUE_HISTORY:
+            item = QListWidgetItem(entry["display"])
+            item.setData(Qt.ItemDataRole.UserRole, entry)
+            self.list_widget.addItem(item)
 
     def _extract_info(self):
         item = self.list_widget.currentItem()
         if not item:
             return None
-        return self.main.extract_queue_item_info(item.text())
+        return item.data(Qt.ItemDataRole.UserRole)
 
     def _ban_song(self):
         info = self._extract_info()
         if info and info.get("song_id"):
             song_id = info["song_id"]
             song_title = info["song_title"]
-            if not any(song_id == x["id"] for x in self.main.BANNED_IDS):
-                self.main.BANNED_IDS.append({"id": song_id, "name": song_title})
-                save_banned_ids(self.main.BANNED_IDS, self.main.BANNED_IDS_PATH)
+            if not has_entry(BANNED_IDS_TABLE, song_id):
+                entry = self.main.BANNED_IDS[song_id] = ModerationEntry(song_id, song_title)
+                add_entry(BANNED_IDS_TABLE, song_id, song_title)
+                self.main.show_list_entry("banned_ids_list", entry)
                 logging.info(f"Banned song '{song_title}' ({song_id})")
             self._refresh_list()
 
@@ -369,8 +258,9 @@ class QueueHistoryWindow(QDialog):
         if info and info.get("user_id"):
             user_id = info["user_id"]
             username = info["username"]
-            if not any(user_id == x["id"] for x in self.main.BANNED_USERS):
-                self.main.BANNED_USERS.append({"id": user_id, "name": username})
-                save_banned_users(self.main.BANNED_USERS, self.main.BANNED_USERS_PATH)
+            if not has_entry(BANNED_USERS_TABLE, user_id):
+                entry = self.main.BANNED_USERS[user_id] = ModerationEntry(user_id, username)
+                add_entry(BANNED_USERS_TABLE, user_id, username)
+                self.main.show_list_entry("banned_users_list", entry)
                 logging.info(f"Banned user '{username}' ({user_id})")
             self._refresh_list()
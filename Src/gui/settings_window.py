@@ -8,6 +8,60 @@ from PySide6.QtWidgets import (
 )
 from settings import Settings
 
+# Settings key -> (label, spin box maximum) for the fields shared by the settings
+# and config dialogs. The widget type follows the field's type in Settings.
+SETTING_WIDGETS = {
+    "PREFIX": ("Command Prefix:", None),
+    "QUEUE_COMMAND": ("Queue Command:", None),
+    "RATE_LIMIT_SECONDS": ("Rate Limit (seconds):", 999999),
+    "TOAST_NOTIFICATIONS": ("Enable Toast Notifications", None),
+    "SONG_FINISH_NOTIFICATIONS": ("Notify When New Song Starts", None),
+    "ALLOW_URLS": ("Allow URL Requests", None),
+    "REQUIRE_MEMBERSHIP": ("Require Membership to request", None),
+    "REQUIRE_SUPERCHAT": ("Require Superchat to request", None),
+    "MINIMUM_SUPERCHAT": ("Minimum Superchat (USD):", 9999),
+    "ENFORCE_USER_WHITELIST": ("Enforce User Whitelist", None),
+    "ENFORCE_ID_WHITELIST": ("Enforce Song Whitelist", None),
+    "AUTOBAN_USERS": ("Autoban users", None),
+    "AUTOREMOVE_SONGS": ("Automatically remove songs", None),
+}
+
+
+def add_setting_widgets(dialog, form: QFormLayout) -> None:
+    """Create a widget for every SETTING_WIDGETS field, filled from Settings, and add it to form."""
+    dialog.setting_widgets = {}
+    for key, (label, maximum) in SETTING_WIDGETS.items():
+        value = getattr(Settings, key)
+        if isinstance(value, bool):
+            widget = QCheckBox(label)
+            widget.setChecked(value)
+            form.addRow(widget)
+        elif isinstance(value, int):
+            widget = QSpinBox()
+            widget.setRange(0, maximum)
+            widget.setValue(value)
+            form.addRow(label, widget)
+        else:
+            widget = QLineEdit()
+            widget.setText(value)
+            form.addRow(label, widget)
+        dialog.setting_widgets[key] = widget
+
+
+def _widget_value(widget):
+    """Read the value of a settings widget."""
+    if isinstance(widget, QCheckBox):
+        return widget.isChecked()
+    if isinstance(widget, QSpinBox):
+        return widget.value()
+    return widget.text().strip()
+
+
+def apply_setting_widgets(dialog) -> None:
+    """Read every widget created by add_setting_widgets() from dialog into Settings."""
+    for key, widget in dialog.setting_widgets.items():
+        setattr(Settings, key, _widget_value(widget))
+
 
 class SettingsWindow(QDialog):
     def __init__(self, main_module):
@@ -19,59 +73,7 @@ class SettingsWindow(QDialog):
         layout = QVBoxLayout(self)
         form = QFormLayout()
 
-        self.prefix_input = QLineEdit()
-        self.prefix_input.setText(Settings.PREFIX)
-        form.addRow("Command Prefix:", self.prefix_input)
-
-        self.queue_input = QLineEdit()
-        self.queue_input.setText(Settings.QUEUE_COMMAND)
-        form.addRow("Queue Command:", self.queue_input)
-
-        self.rate_limit_input = QSpinBox()
-        self.rate_limit_input.setRange(0, 999999)
-        self.rate_limit_input.setValue(Settings.RATE_LIMIT_SECONDS)
-        form.addRow("Rate Limit (seconds):", self.rate_limit_input)
-
-        self.toast_checkbox = QCheckBox("Enable Toast Notifications")
-        self.toast_checkbox.setChecked(Settings.TOAST_NOTIFICATIONS)
-        form.addRow(self.toast_checkbox)
-
-        self.song_finish_checkbox = QCheckBox("Notify When New Song Starts")
-        self.song_finish_checkbox.setChecked(Settings.SONG_FINISH_NOTIFICATIONS)
-        form.addRow(self.song_finish_checkbox)
-
-        self.allow_urls_checkbox = QCheckBox("Allow URL Requests")
-        self.allow_urls_checkbox.setChecked(Settings.ALLOW_URLS)
-        form.addRow(self.allow_urls_checkbox)
-
-        self.require_membership_checkbox = QCheckBox("Require Membership to request")
-        self.require_membership_checkbox.setChecked(Settings.REQUIRE_MEMBERSHIP)
-        form.addRow(self.require_membership_checkbox)
-
-        self.require_superchat_checkbox = QCheckBox("Require Superchat to request")
-        self.require_superchat_checkbox.setChecked(Settings.REQUIRE_SUPERCHAT)
-        form.addRow(self.require_superchat_checkbox)
-
-        self.minimum_superchat_input = QSpinBox()
-        self.minimum_superchat_input.setRange(0, 9999)
-        self.minimum_superchat_input.setValue(Settings.MINIMUM_SUPERCHAT)
-        form.addRow("Minimum Superchat (USD):", self.minimum_superchat_input)
-
-        self.enforce_user_whitelist_checkbox = QCheckBox("Enforce User Whitelist")
-        self.enforce_user_whitelist_checkbox.setChecked(Settings.ENFORCE_USER_WHITELIST)
-        form.addRow(self.enforce_user_whitelist_checkbox)
-
-        self.enforce_id_whitelist_checkbox = QCheckBox("Enforce Song Whitelist")
-        self.enforce_id_whitelist_checkbox.setChecked(Settings.ENFORCE_ID_WHITELIST)
-        form.addRow(self.enforce_id_whitelist_checkbox)
-
-        self.autoban_checkbox = QCheckBox("Autoban users")
-        self.autoban_checkbox.setChecked(Settings.AUTOBAN_USERS)
-        form.addRow(self.autoban_checkbox)
-
-        self.autoremove_checkbox = QCheckBox("Automatically remove songs")
-        self.autoremove_checkbox.setChecked(Settings.AUTOREMOVE_SONGS)
-        form.addRow(self.autoremove_checkbox)
+        add_setting_widgets(self, form)
 
         layout.addLayout(form)
 
@@ -80,18 +82,6 @@ class SettingsWindow(QDialog):
         layout.addWidget(btn)
 
     def _save(self):
-        Settings.RATE_LIMIT_SECONDS = self.rate_limit_input.value()
-        Settings.TOAST_NOTIFICATIONS = self.toast_checkbox.isChecked()
-        Settings.PREFIX = self.prefix_input.text().strip()
-        Settings.QUEUE_COMMAND = self.queue_input.text().strip()
-        Settings.ALLOW_URLS = self.allow_urls_checkbox.isChecked()
-        Settings.REQUIRE_MEMBERSHIP = self.require_membership_checkbox.isChecked()
-        Settings.REQUIRE_SUPERCHAT = self.require_superchat_checkbox.isChecked()
-        Settings.MINIMUM_SUPERCHAT = self.minimum_superchat_input.value()
-        Settings.ENFORCE_USER_WHITELIST = self.enforce_user_whitelist_checkbox.isChecked()
-        Settings.ENFORCE_ID_WHITELIST = self.enforce_id_whitelist_checkbox.isChecked()
-        Settings.AUTOREMOVE_SONGS = self.autoremove_checkbox.isChecked()
-        Settings.AUTOBAN_USERS = self.autoban_checkbox.isChecked()
-        Settings.SONG_FINISH_NOTIFICATIONS = self.song_finish_checkbox.isChecked()
-        Settings.save()
+        apply_setting_widgets(self)
+        Settings.schedule_save()
         self.accept()
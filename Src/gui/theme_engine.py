@@ -5,15 +5,25 @@
 import logging
 from typing import Optional
 
-# Theme color key to Qt/CSS mapping
-_COLOR_KEYS = [
-    "WindowBg", "FrameBg", "Button", "ButtonHovered", "ButtonActive",
-    "Text", "SliderGrab", "SliderGrabActive", "Header", "ScrollbarBg",
-    "ScrollbarGrab", "ScrollbarGrabHovered", "ScrollbarGrabActive",
-    "CheckMark", "HeaderHovered", "HeaderActive", "Tab", "TabHovered",
-    "TabActive", "TitleBg", "TitleBgActive", "TitleBgCollapsed",
-    "MenuBarBg", "Border", "Separator", "PopupBg", "TextSelectedBg"
-]
+# Generated stylesheets by theme name, so switching back to a theme (or re-applying
+# the current one) does not reload and reconvert its file. Cleared on theme reload.
+_qss_cache: dict = {}
+
+# Theme color keys used in the stylesheet, with the default used when a theme omits one.
+# Order matches the unpacking in theme_data_to_qss().
+_QSS_COLORS = (
+    ("WindowBg", (25, 25, 25, 255)),
+    ("FrameBg", (35, 35, 35, 255)),
+    ("Button", (60, 70, 60, 255)),
+    ("ButtonHovered", (80, 120, 80, 255)),
+    ("ButtonActive", (100, 150, 100, 255)),
+    ("Text", (220, 220, 220, 255)),
+    ("SliderGrab", (100, 150, 100, 255)),
+    ("SliderGrabActive", (120, 180, 120, 255)),
+    ("Border", (70, 90, 70, 255)),
+    ("MenuBarBg", (30, 30, 30, 255)),
+    ("PopupBg", (35, 35, 35, 240)),
+)
 
 
 def _rgba_to_hex(rgba: list) -> str:
@@ -46,18 +56,11 @@ def theme_data_to_qss(theme_data: dict) -> str:
     colors = theme_data.get("colors", {})
     styles = theme_data.get("styles", {})
     
-    # Build CSS variables
-    bg = _rgba_to_hex(colors.get("WindowBg", [25, 25, 25, 255]))
-    frame_bg = _rgba_to_hex(colors.get("FrameBg", [35, 35, 35, 255]))
-    btn = _rgba_to_hex(colors.get("Button", [60, 70, 60, 255]))
-    btn_hover = _rgba_to_hex(colors.get("ButtonHovered", [80, 120, 80, 255]))
-    btn_active = _rgba_to_hex(colors.get("ButtonActive", [100, 150, 100, 255]))
-    text = _rgba_to_hex(colors.get("Text", [220, 220, 220, 255]))
-    slider_grab = _rgba_to_hex(colors.get("SliderGrab", [100, 150, 100, 255]))
-    slider_active = _rgba_to_hex(colors.get("SliderGrabActive", [120, 180, 120, 255]))
-    border = _rgba_to_hex(colors.get("Border", [70, 90, 70, 255]))
-    menu_bg = _rgba_to_hex(colors.get("MenuBarBg", [30, 30, 30, 255]))
-    popup_bg = _rgba_to_hex(colors.get("PopupBg", [35, 35, 35, 240]))
+    # Build CSS variables (same order as _QSS_COLORS)
+    (bg, frame_bg, btn, btn_hover, btn_active, text,
+     slider_grab, slider_active, border, menu_bg, popup_bg) = (
+        _rgba_to_hex(colors.get(key, default)) for key, default in _QSS_COLORS
+    )
     
     rounding = styles.get("FrameRounding", 8)
     window_rounding = styles.get("WindowRounding", 12)
@@ -231,6 +234,11 @@ def get_theme_styles(theme_data: dict) -> dict:
     return theme_data.get("styles", {})
 
 
+def clear_qss_cache() -> None:
+    """Forget generated stylesheets (call after theme files change on disk)."""
+    _qss_cache.clear()
+
+
 def apply_theme_to_app(app, theme_name: str, load_theme_from_file,
                        get_theme_type=None, load_qss_from_file=None) -> bool:
     """
@@ -254,21 +262,22 @@ def apply_theme_to_app(app, theme_name: str, load_theme_from_file,
             get_theme_type = get_theme_type or _gtt
             load_qss_from_file = load_qss_from_file or _lqf
 
-        theme_type = get_theme_type(theme_name)
-
-        if theme_type == "qss":
-            qss = load_qss_from_file(theme_name)
+        qss = _qss_cache.get(theme_name)
+        if qss is None:
+            if get_theme_type(theme_name) == "qss":
+                qss = load_qss_from_file(theme_name)
+            else:
+                theme_data = load_theme_from_file(theme_name)
+                qss = theme_data_to_qss(theme_data) if theme_data else None
             if qss:
-                app.setStyleSheet(qss)
-                logging.info(f"Applied QSS theme: {theme_name}")
-                return True
-        else:
-            theme_data = load_theme_from_file(theme_name)
-            if theme_data:
-                qss = theme_data_to_qss(theme_data)
+                _qss_cache[theme_name] = qss
+
+        if qss:
+            # Re-polishing every widget is expensive; skip if this stylesheet is already active
+            if app.styleSheet() != qss:
                 app.setStyleSheet(qss)
                 logging.info(f"Applied theme: {theme_name}")
-                return True
+            return True
 
         logging.warning(f"Theme not found: {theme_name}")
         return False
@@ -12,9 +12,10 @@ class ThreadBridge(QObject):
     update_time_text = Signal(str)          # "MM:SS / MM:SS"
     update_now_playing = Signal(str)        # "Now Playing: Title"
     refresh_list = Signal(str, list)         # list_id, items
+    update_list_item = Signal(str, str, str) # list_id, item id, display text
     show_window = Signal(str, bool)         # window_tag, show
     enable_menu_item = Signal(str, bool)    # item_tag, enabled
     show_download_ui = Signal(str)           # latest_version
-    set_console_text = Signal(str)           # append log line (thread-safe)
+    console_lines_ready = Signal()           # GuiLogger has buffered log lines (emitted once per batch)
     hide_update_ui = Signal()                # hide update notification
     request_theme_reload = Signal()          # theme file changed, reload on GUI thread
@@ -2,22 +2,55 @@
 # CURRENCY CONVERSION
 # =============================================================================
 
+# Standard Library Imports
+import threading
+import time
+from typing import Dict, Tuple
+
 # Third-Party Imports
 import forex_python.converter  # Currency conversion for superchat values
 
 # =============================================================================
 
+# Cache for exchange rates to avoid a network request per superchat
+_converter = forex_python.converter.CurrencyRates()
+_rate_cache: Dict[str, Tuple[float, float]] = {}  # currency -> (expiry timestamp, rate to USD)
+_rate_cache_lock = threading.Lock()
+RATE_CACHE_DURATION = 3600  # Cache for 1 hour
+
+def get_usd_rate(currency_name: str) -> float:
+    """
+    Get the exchange rate from a currency to USD, cached for RATE_CACHE_DURATION.
+
+    Args:
+        currency_name: Source currency code
+
+    Returns:
+        float: Amount of USD per unit of the currency
+    """
+    if currency_name == 'USD':
+        return 1.0
+
+    with _rate_cache_lock:
+        now = time.time()
+        cached = _rate_cache.get(currency_name)
+        if cached and cached[0] > now:
+            return cached[1]
+        rate = _converter.get_rate(currency_name, 'USD')
+        _rate_cache[currency_name] = (now + RATE_CACHE_DURATION, rate)
+        return rate
+
 def convert_to_usd(value: float = 1, currency_name: str = "USD") -> float:
     """
     Convert currency value to USD.
-    
+
     Args:
         value: Amount to convert
         currency_name: Source currency code
-        
+
     Returns:
         float: Value in USD
     """
-    converter = forex_python.converter.CurrencyRates()
-    usd_value = converter.convert(currency_name, 'USD', value)
-    return usd_value
\ No newline at end of file
+    if currency_name == 'USD':
+        return value
+    return value * get_usd_rate(currency_name)
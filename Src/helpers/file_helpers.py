@@ -10,6 +10,16 @@ import sys
 from datetime import datetime
 import platform
 import subprocess
+import uuid
+
+# Optional: orjson is much faster than json and returns bytes directly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed JSON files by path: path -> (mtime_ns, data). See load_json_cached().
+_json_cache: dict = {}
 
 # =============================================================================
 
@@ -90,6 +100,111 @@ def get_app_folder() -> str:
     # and go up one level to get the Src directory
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+def read_json_file(filepath: str):
+    """
+    Read and parse a JSON file in one go (orjson when installed, json otherwise).
+    
+    Args:
+        filepath: Path to the JSON file
+    
+    Returns:
+        The parsed JSON data
+    
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON (orjson's error subclasses it)
+    """
+    with open(filepath, 'rb') as f:
+        return parse_json(f.read())
+
+def parse_json(raw: bytes | str):
+    """
+    Parse a JSON document (orjson when installed, json otherwise).
+    
+    Args:
+        raw: JSON text as bytes or str
+    
+    Returns:
+        The parsed JSON data
+    
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def load_json_cached(filepath: str):
+    """
+    Read a JSON file, reusing the previous parse while its mtime is unchanged.
+    
+    The returned object is shared between callers and must not be modified.
+    
+    Args:
+        filepath: Path to the JSON file
+    
+    Returns:
+        The parsed JSON data
+    """
+    mtime_ns = os.stat(filepath).st_mtime_ns
+    cached = _json_cache.get(filepath)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    data = read_json_file(filepath)
+    _json_cache[filepath] = (mtime_ns, data)
+    return data
+
+def dump_json_bytes(data, indent: int | None = 4) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+    
+    Uses orjson when it is installed and supports the requested indentation
+    (compact or 2 spaces), otherwise falls back to the standard json module.
+    Either way non-ASCII text is written as-is rather than \\u-escaped, and
+    compact output has no spaces after separators.
+    
+    Args:
+        data: JSON-serializable data
+        indent: JSON indentation (None for compact output)
+    
+    Returns:
+        bytes: The encoded JSON document
+    """
+    if orjson is not None and indent in (None, 2):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    separators = (',', ':') if indent is None else None
+    return json.dumps(data, indent=indent, separators=separators, ensure_ascii=False).encode('utf-8')
+
+def write_json_atomic(filepath: str, data, durable: bool = True, indent: int | None = 4) -> None:
+    """
+    Write JSON data to a file atomically (temp file + os.replace).
+    
+    The data is serialized up front and written in a single call, so a
+    serialization error never touches the disk and a crash mid-write leaves
+    the previous file intact instead of a truncated one.
+    
+    Args:
+        filepath: Path to the file to write
+        data: JSON-serializable data
+        durable: fsync the temp file before renaming (skip for frequent, low-value writes)
+        indent: JSON indentation (None for compact output)
+    """
+    payload = dump_json_bytes(data, indent)
+    tmp_path = f"{filepath}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def ensure_file_exists(filepath: str, default_content) -> None:
     """
     Create a file with default content if it doesn't exist.
@@ -99,8 +214,7 @@ def ensure_file_exists(filepath: str, default_content) -> None:
         default_content: Default content to write to the file
     """
     if not os.path.isfile(filepath):
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(default_content, f, indent=4)
+        write_json_atomic(filepath, default_content)
         logging.info(f"Created missing file: {filepath}")
 
 def ensure_json_valid(filepath: str, default_content: dict) -> None:
@@ -109,23 +223,27 @@ def ensure_json_valid(filepath: str, default_content: dict) -> None:
     
     This function ensures the JSON file is valid and contains only expected keys.
     If the file is corrupted or contains extra keys, it will be cleaned up.
+    A file that already has exactly the expected keys is left untouched.
     
     Args:
         filepath: Path to the JSON file to validate
         default_content: Default configuration structure to validate against
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                # Reset to defaults if file is corrupted
-                with open(filepath, 'w', encoding='utf-8') as fw:
-                    json.dump(default_content, fw, indent=4)
-                logging.warning(f"Invalid JSON in {filepath}. Resetting to default.")
-                return
-
-        modified = False
+        try:
+            data = read_json_file(filepath)
+        except json.JSONDecodeError:
+            # Keep the corrupted file for inspection, then reset to defaults
+            backup_path = _backup_path(filepath)
+            os.replace(filepath, backup_path)
+            write_json_atomic(filepath, default_content)
+            logging.warning(f"Invalid JSON in {filepath}. Moved it to {backup_path} and reset to default.")
+            return
+
+        # Fast path: nothing missing and nothing extra
+        if isinstance(data, dict) and data.keys() == default_content.keys():
+            return
+
         cleaned_data = {}
 
         # Copy over valid keys from default_config
@@ -134,27 +252,26 @@ def ensure_json_valid(filepath: str, default_content: dict) -> None:
                 cleaned_data[key] = data[key]
             else:
                 cleaned_data[key] = default_value
-                modified = True
                 logging.info(f"Added missing key '{key}' to {filepath}")
 
         # Check for and remove extra keys
-        extra_keys = set(data.keys()) - set(default_content.keys())
+        extra_keys = data.keys() - default_content.keys()
         if extra_keys:
-            modified = True
             logging.info(f"Removing extra keys from {filepath}: {extra_keys}")
 
-        if modified:
-            # Create a backup before making changes
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_path = f"{filepath}.backup_{timestamp}.json"
-            with open(backup_path, 'w', encoding='utf-8') as backup_file:
-                json.dump(data, backup_file, indent=4)
+            # Only back up when values are being dropped; adding defaults loses nothing
+            backup_path = _backup_path(filepath)
+            write_json_atomic(backup_path, data)
             logging.info(f"Backed up original config file to {backup_path}")
 
-            # Write cleaned data
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(cleaned_data, f, indent=4)
-            logging.info(f"Successfully cleaned and updated {filepath}")
+        # Write cleaned data
+        write_json_atomic(filepath, cleaned_data)
+        logging.info(f"Successfully cleaned and updated {filepath}")
 
     except Exception as e:
-        logging.error(f"Error validating JSON file {filepath}: {e}")
\ No newline at end of file
+        logging.error(f"Error validating JSON file {filepath}: {e}")
+
+def _backup_path(filepath: str) -> str:
+    """Return a timestamped backup path next to filepath."""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return f"{filepath}.backup_{timestamp}.json"
@@ -4,90 +4,234 @@
 
 # Standard Library Imports
 import json
+import logging
 import os
+import sqlite3
+import threading
+
+# Local Imports
+from .file_helpers import read_json_file
 
 # =============================================================================
 
-def load_banned_users(banned_users_path: str) -> list:
+# Table names for the moderation lists (each table is: id TEXT PRIMARY KEY, name TEXT)
+BANNED_USERS_TABLE = "banned_users"
+BANNED_IDS_TABLE = "banned_ids"
+WHITELISTED_USERS_TABLE = "whitelisted_users"
+WHITELISTED_IDS_TABLE = "whitelisted_ids"
+MODERATION_TABLES = (
+    BANNED_USERS_TABLE,
+    BANNED_IDS_TABLE,
+    WHITELISTED_USERS_TABLE,
+    WHITELISTED_IDS_TABLE,
+)
+
+class ModerationEntry:
+    """A ban/whitelist entry; the 'Name (ID)' label shown in list widgets is built once."""
+
+    __slots__ = ("id", "_name", "display")
+
+    def __init__(self, entry_id: str, name: str):
+        self.id = entry_id
+        self.name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self.display = f"{value} ({self.id})"
+
+    def __repr__(self) -> str:
+        return f"ModerationEntry({self.id!r}, {self._name!r})"
+
+
+# Shared connection (autocommit + WAL). The chat thread, the GUI thread and the
+# name-fetch workers all touch it, so every statement runs under the lock.
+_db: sqlite3.Connection | None = None
+_db_lock = threading.RLock()
+
+# In-memory ID set per table, kept in step with every write so membership
+# checks on the chat hot path are a hash probe instead of a SQL query.
+_id_index: dict[str, set[str]] = {table: set() for table in MODERATION_TABLES}
+
+
+def init_moderation_db(db_path: str, legacy_json_paths: dict | None = None) -> None:
     """
-    Load banned users list from file.
-    
+    Open the moderation database and create the list tables if needed.
+
+    On first run, entries from the old JSON list files are imported once.
+
     Args:
-        banned_users_path: Path to the banned users JSON file
-        
-    Returns:
-        list: List of banned users
+        db_path: Path to the SQLite database file
+        legacy_json_paths: Optional mapping of table name -> legacy JSON file to import
     """
-    if os.path.exists(banned_users_path):
-        with open(banned_users_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    else:
-        return []
+    global _db
+    with _db_lock:
+        if _db is not None:
+            return
+
+        _db = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        _db.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode this syncs at checkpoints instead of on every commit, so bulk
+        # adds stay cheap; the database cannot be corrupted, at worst the last
+        # few changes are lost on power failure
+        _db.execute("PRAGMA synchronous=NORMAL")
+        for table in MODERATION_TABLES:
+            _db.execute(f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, name TEXT NOT NULL)")
 
-def load_banned_ids(banned_ids_path: str) -> list:
+        # user_version 0 means the legacy JSON files have not been imported yet
+        if _db.execute("PRAGMA user_version").fetchone()[0] == 0:
+            for table, path in (legacy_json_paths or {}).items():
+                _import_legacy_json(table, path)
+            _db.execute("PRAGMA user_version = 1")
+
+        for table in MODERATION_TABLES:
+            _id_index[table] = {row[0] for row in _db.execute(f"SELECT id FROM {table}")}
+
+
+def close_moderation_db() -> None:
+    """Close the moderation database connection."""
+    global _db
+    with _db_lock:
+        if _db is not None:
+            _db.close()
+            _db = None
+
+
+def _get_db() -> sqlite3.Connection:
+    """Return the open database connection."""
+    if _db is None:
+        raise ValueError("Moderation database not initialized. Call init_moderation_db() first.")
+    return _db
+
+
+def _import_legacy_json(table: str, path: str) -> None:
+    """Import a legacy JSON moderation list into its table."""
+    if not os.path.isfile(path):
+        return
+    try:
+        entries = read_json_file(path)
+    except (json.JSONDecodeError, OSError) as e:
+        logging.warning(f"Could not import legacy moderation file {path}: {e}")
+        return
+    if not isinstance(entries, list):
+        logging.warning(f"Could not import legacy moderation file {path}: expected a list, got {type(entries).__name__}")
+        return
+
+    # name is NOT NULL; a missing or null name becomes ""
+    rows = [(str(e["id"]), str(e.get("name") or "")) for e in entries if isinstance(e, dict) and e.get("id")]
+    if len(rows) < len(entries):
+        logging.warning(f"Skipped {len(entries) - len(rows)} malformed entries in {path}")
+    # INSERT OR IGNORE skips duplicates, so rowcount is what was actually imported
+    try:
+        cursor = _get_db().executemany(
+            f"INSERT OR IGNORE INTO {table} (id, name) VALUES (?, ?)",
+            rows
+        )
+    except sqlite3.Error as e:
+        logging.warning(f"Could not import legacy moderation file {path}: {e}")
+        return
+    logging.info(f"Imported {cursor.rowcount} entries from {path} into {table}")
+
+
+def load_entries(table: str) -> dict:
     """
-    Load banned video IDs list from file.
-    
+    Load all entries of a moderation list in insertion order.
+
     Args:
-        banned_ids_path: Path to the banned IDs JSON file
-        
+        table: Moderation table name (see MODERATION_TABLES)
+
     Returns:
-        list: List of banned video IDs
+        dict: ID -> ModerationEntry, so lookups and removals by ID are O(1)
     """
-    if os.path.exists(banned_ids_path):
-        with open(banned_ids_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    else:
-        return []
+    with _db_lock:
+        rows = _get_db().execute(f"SELECT id, name FROM {table} ORDER BY rowid").fetchall()
+        _id_index[table] = {entry_id for entry_id, _ in rows}
+    return {entry_id: ModerationEntry(entry_id, name) for entry_id, name in rows}
 
-def load_whitelisted_users(whitelisted_users_path: str) -> list:
+
+def get_data_version() -> int:
     """
-    Load whitelisted users list from file.
-    
-    Args:
-        whitelisted_users_path: Path to the whitelisted users JSON file
-        
+    Return SQLite's data_version for the moderation database.
+
+    The value only changes when another connection (a second LYTE instance, a
+    database editor) commits. Writes made through this module do not change
+    it, since their callers update the in-memory lists themselves.
+    """
+    with _db_lock:
+        return _get_db().execute("PRAGMA data_version").fetchone()[0]
+
+
+def has_entry(table: str, entry_id: str) -> bool:
+    """Check whether an ID is present in a moderation list (in-memory set lookup)."""
+    return entry_id in _id_index[table]
+
+
+def add_entry(table: str, entry_id: str, name: str) -> None:
+    """Add an entry to a moderation list, or update its name if already present."""
+    with _db_lock:
+        _get_db().execute(
+            f"INSERT INTO {table} (id, name) VALUES (?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET name = excluded.name",
+            (entry_id, name)
+        )
+        _id_index[table].add(entry_id)
+
+
+def rename_entry(table: str, entry_id: str, name: str) -> bool:
+    """
+    Update the name of an existing entry without re-adding it if it was removed.
+
     Returns:
-        list: List of whitelisted users
+        bool: True if the entry exists and was renamed
     """
-    if os.path.exists(whitelisted_users_path):
-        with open(whitelisted_users_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    else:
-        return []
+    with _db_lock:
+        cursor = _get_db().execute(f"UPDATE {table} SET name = ? WHERE id = ?", (name, entry_id))
+        return cursor.rowcount > 0
+
+
+def remove_entry(table: str, entry_id: str) -> None:
+    """Remove an entry from a moderation list."""
+    with _db_lock:
+        _get_db().execute(f"DELETE FROM {table} WHERE id = ?", (entry_id,))
+        _id_index[table].discard(entry_id)
+
 
-def load_whitelisted_ids(whitelisted_ids_path: str) -> list:
+def load_banned_users() -> dict:
     """
-    Load whitelisted video IDs list from file.
-    
-    Args:
-        whitelisted_ids_path: Path to the whitelisted IDs JSON file
-        
+    Load banned users list from the moderation database.
+
+    Returns:
+        dict: Banned users by channel ID
+    """
+    return load_entries(BANNED_USERS_TABLE)
+
+def load_banned_ids() -> dict:
+    """
+    Load banned video IDs list from the moderation database.
+
     Returns:
-        list: List of whitelisted video IDs
-    """
-    if os.path.exists(whitelisted_ids_path):
-        with open(whitelisted_ids_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    else:
-        return []
-
-def save_banned_users(banned_users: list, banned_users_path: str) -> None:
-    """Save banned users list to file."""
-    with open(banned_users_path, "w", encoding="utf-8") as f:
-        json.dump(banned_users, f, indent=4)
-
-def save_banned_ids(banned_ids: list, banned_ids_path: str) -> None:
-    """Save banned video IDs list to file."""
-    with open(banned_ids_path, "w", encoding="utf-8") as f:
-        json.dump(banned_ids, f, indent=4)
-
-def save_whitelisted_users(whitelisted_users: list, whitelisted_users_path: str) -> None:
-    """Save whitelisted users list to file."""
-    with open(whitelisted_users_path, "w", encoding="utf-8") as f:
-        json.dump(whitelisted_users, f, indent=4)
-
-def save_whitelisted_ids(whitelisted_ids: list, whitelisted_ids_path: str) -> None:
-    """Save whitelisted video IDs list to file."""
-    with open(whitelisted_ids_path, "w", encoding="utf-8") as f:
-        json.dump(whitelisted_ids, f, indent=4)
\ No newline at end of file
+        dict: Banned videos by video ID
+    """
+    return load_entries(BANNED_IDS_TABLE)
+
+def load_whitelisted_users() -> dict:
+    """
+    Load whitelisted users list from the moderation database.
+
+    Returns:
+        dict: Whitelisted users by channel ID
+    """
+    return load_entries(WHITELISTED_USERS_TABLE)
+
+def load_whitelisted_ids() -> dict:
+    """
+    Load whitelisted video IDs list from the moderation database.
+
+    Returns:
+        dict: Whitelisted videos by video ID
+    """
+    return load_entries(WHITELISTED_IDS_TABLE)
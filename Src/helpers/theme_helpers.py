@@ -9,6 +9,9 @@ import os
 import shutil
 import sys
 
+# Local Imports
+from .file_helpers import load_json_cached, write_json_atomic
+
 # =============================================================================
 
 # Global theme state (will be initialized by init_theme_system)
@@ -78,8 +81,7 @@ def discover_themes() -> dict:
                     theme_name = filename[:-5]
                     theme_path = os.path.join(folder, filename)
                     try:
-                        with open(theme_path, 'r', encoding='utf-8') as f:
-                            theme_data = json.load(f)
+                        theme_data = load_json_cached(theme_path)
                         display_name = theme_data.get('name', theme_name.replace('_', ' ').title())
                         _register_theme(themes, theme_name, display_name, filename, "json", path_key, theme_path)
                     except (json.JSONDecodeError, IOError) as e:
@@ -120,8 +122,7 @@ def load_theme_from_file(theme_name: str) -> dict | None:
         user_theme_path = os.path.join(THEMES_FOLDER, f"{theme_name}.json")
         if os.path.exists(user_theme_path):
             try:
-                with open(user_theme_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return load_json_cached(user_theme_path)
             except (json.JSONDecodeError, IOError) as e:
                 logging.error(f"Error loading theme from {user_theme_path}: {e}")
                 return None
@@ -130,8 +131,7 @@ def load_theme_from_file(theme_name: str) -> dict | None:
         bundle_theme_path = os.path.join(sys._MEIPASS, 'themes', f"{theme_name}.json")
         if os.path.exists(bundle_theme_path):
             try:
-                with open(bundle_theme_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return load_json_cached(bundle_theme_path)
             except (json.JSONDecodeError, IOError) as e:
                 logging.error(f"Error loading bundled theme: {e}")
                 return None
@@ -232,8 +232,7 @@ def create_default_theme_files() -> None:
                 "ItemInnerSpacing": [6, 6]
             }
         }
-        with open(dark_theme_path, 'w', encoding='utf-8') as f:
-            json.dump(default_dark_theme, f, indent=4)
+        write_json_atomic(dark_theme_path, default_dark_theme)
         logging.info(f"Created default dark theme file: {dark_theme_path}")
 
     light_theme_path = os.path.join(THEMES_FOLDER, "light_theme.json")
@@ -283,8 +282,7 @@ def create_default_theme_files() -> None:
                 "ItemInnerSpacing": [6, 6]
             }
         }
-        with open(light_theme_path, 'w', encoding='utf-8') as f:
-            json.dump(default_light_theme, f, indent=4)
+        write_json_atomic(light_theme_path, default_light_theme)
         logging.info(f"Created default light theme file: {light_theme_path}")
 
     demo_theme_path = os.path.join(THEMES_FOLDER, "demo_theme.json.demo")
@@ -334,8 +332,7 @@ def create_default_theme_files() -> None:
                 "ItemInnerSpacing": [6, 6]
             }
         }
-        with open(demo_theme_path, 'w', encoding='utf-8') as f:
-            json.dump(demo_theme, f, indent=4)
+        write_json_atomic(demo_theme_path, demo_theme)
         logging.info(f"Created demo theme file: {demo_theme_path}")
 
     # Copy bundled premade themes (aurora, custom template) if not present
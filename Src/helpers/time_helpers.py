@@ -2,6 +2,12 @@
 # TIME FORMATTING
 # =============================================================================
 
+# Standard Library Imports
+import logging
+import time
+
+# =============================================================================
+
 def format_time(seconds: float) -> str:
     """
     Format time in seconds to MM:SS format.
@@ -14,4 +20,31 @@ def format_time(seconds: float) -> str:
     """
     minutes = int(seconds // 60)
     seconds = int(seconds % 60)
-    return f"{minutes:02d}:{seconds:02d}"
\ No newline at end of file
+    return f"{minutes:02d}:{seconds:02d}"
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Log formatter that runs strftime once per second instead of once per record.
+    
+    Records logged within the same second reuse the cached date/time text; only
+    the milliseconds are filled in per record. One instance can be shared by
+    several handlers, so they also share the cache.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (whole second, formatted text) swapped as one tuple, so threads never
+        # see a second paired with another second's text
+        self._cached_second = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._cached_second
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_second = (second, text)
+        if self.default_msec_format:
+            return self.default_msec_format % (text, record.msecs)
+        return text
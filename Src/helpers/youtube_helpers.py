@@ -3,13 +3,23 @@
 # =============================================================================
 
 # Standard Library Imports
+import logging
 import re
+import threading
 import time
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 # Third-Party Imports
 import requests  # HTTP requests for faster fetching
-import yt_dlp  # YouTube video/audio extraction (still needed for audio URLs)
+
+# yt_dlp (audio URLs and name fallbacks) takes a noticeable share of startup to
+# import, so it is only imported by _extract_info() once a lookup needs it
+if TYPE_CHECKING:
+    import yt_dlp
+
+# Local Imports
+from .file_helpers import read_json_file, write_json_atomic
 
 # =============================================================================
 
@@ -19,6 +29,82 @@ _channel_name_cache: Dict[str, str] = {}
 _cache_timestamps: Dict[str, float] = {}
 CACHE_DURATION = 3600  # Cache for 1 hour
 
+# Video titles and channel names persisted across restarts (see load_name_cache / save_name_cache).
+# File layout: {"videos": {id: [name, fetched_at]}, "channels": {id: [name, fetched_at]}}
+_PERSISTED_CACHES = {"videos": _video_title_cache, "channels": _channel_name_cache}
+_name_cache_path: Optional[str] = None
+_name_fetch_times: Dict[str, Dict[str, float]] = {kind: {} for kind in _PERSISTED_CACHES}
+_unsaved_names = 0
+# Guards _unsaved_names and the file write: names arrive from the name fetch
+# pool and the song request worker at the same time
+_name_cache_lock = threading.RLock()
+NAME_CACHE_MAX_AGE = 7 * 24 * 3600  # Drop persisted names after a week
+NAME_CACHE_SAVE_EVERY = 25  # Write the file after this many new names
+
+# Shared HTTP session for oEmbed and channel page lookups. Reusing it keeps the
+# connection to youtube.com alive, so adding many IDs at once pays for the
+# TCP/TLS handshake once instead of per lookup. The connection pool is thread-safe.
+_http_session = requests.Session()
+_http_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+
+# Name lookups for newly added moderation entries run on this pool, so adding
+# many IDs at once reuses a few threads instead of starting one per entry
+NAME_FETCH_WORKERS = 10
+name_fetch_pool = ThreadPoolExecutor(max_workers=NAME_FETCH_WORKERS, thread_name_prefix="yt-meta")
+
+# Resolved audio streams: url -> (expiry timestamp, direct url, title).
+# Stream URLs carry their own expiry (usually ~6 hours out); an entry is reused
+# until AUDIO_EXPIRY_MARGIN before it, so a re-requested song still has time to
+# play. URLs without an expiry are kept for AUDIO_CACHE_DURATION.
+_audio_cache: Dict[str, Tuple[float, str, str]] = {}
+AUDIO_CACHE_DURATION = 300  # Cache for 5 minutes
+AUDIO_EXPIRY_MARGIN = 3600  # Stop reusing a stream URL an hour before it expires
+AUDIO_CACHE_MAX_ENTRIES = 512
+_STREAM_EXPIRE_RE = re.compile(r"[?&/]expire[=/](\d+)")
+
+# Long-lived yt_dlp extractors, one per option set, created on first use.
+# YoutubeDL is not thread-safe, so each one is only used under its own lock.
+# Every option set gives up on stalled sockets instead of holding the lock.
+# (yt-dlp already requests every compression it supports, so no Accept-Encoding.)
+_YDL_BASE_OPTIONS = {
+    'quiet': True,
+    'socket_timeout': 10,
+}
+_YDL_OPTIONS = {
+    "audio": {**_YDL_BASE_OPTIONS, 'format': 'bestaudio'},
+    "flat": {**_YDL_BASE_OPTIONS, 'extract_flat': True},
+    # Only the channel's own metadata is needed: extract_flat leaves the video entries
+    # unresolved and playlistend stops yt-dlp from paging through the channel's uploads
+    "channel": {**_YDL_BASE_OPTIONS, "no_warnings": True, "skip_download": True,
+                "extract_flat": True, "playlistend": 1},
+}
+_ydl_instances: Dict[str, "yt_dlp.YoutubeDL"] = {}
+_ydl_locks: Dict[str, threading.Lock] = {kind: threading.Lock() for kind in _YDL_OPTIONS}
+
+def _extract_info(kind: str, url: str) -> dict:
+    """
+    Run extract_info on the shared YoutubeDL instance for kind (see _YDL_OPTIONS).
+    
+    A DownloadError (private, removed or region-locked video, ...) says nothing
+    about the instance, so it is kept. Only an unexpected exception drops it,
+    so a broken one is rebuilt on the next call.
+    """
+    import yt_dlp
+
+    with _ydl_locks[kind]:
+        ydl = _ydl_instances.get(kind)
+        if ydl is None:
+            ydl = _ydl_instances[kind] = yt_dlp.YoutubeDL(_YDL_OPTIONS[kind])
+        try:
+            return ydl.extract_info(url, download=False)
+        except yt_dlp.utils.DownloadError:
+            raise
+        except Exception:
+            del _ydl_instances[kind]
+            raise
+
 def _is_cache_valid(key: str) -> bool:
     """Check if cached data is still valid."""
     if key not in _cache_timestamps:
@@ -36,6 +122,90 @@ def _set_cache(key: str, value: str, cache_dict: Dict[str, str]) -> None:
     cache_dict[key] = value
     _cache_timestamps[key] = time.time()
 
+def _remember_name(kind: str, key: str, name: str) -> None:
+    """Cache a video title ("videos") or channel name ("channels") and mark it for the persistent cache."""
+    global _unsaved_names
+    _set_cache(key, name, _PERSISTED_CACHES[kind])
+    _name_fetch_times[kind][key] = time.time()
+    with _name_cache_lock:
+        if _name_cache_path:
+            _unsaved_names += 1
+            if _unsaved_names >= NAME_CACHE_SAVE_EVERY:
+                save_name_cache()
+
+def load_name_cache(path: str) -> None:
+    """
+    Load persisted video titles and channel names and remember where to save them.
+    
+    Names fetched within NAME_CACHE_MAX_AGE are loaded as if they had just been
+    looked up, so each is served from memory for CACHE_DURATION before the next
+    request refreshes it; older ones are dropped. Malformed entries are skipped.
+    
+    The save path is only set once loading is done (even if it failed), so a
+    save_name_cache() racing a load on another thread cannot overwrite the file
+    with a partial cache.
+    
+    Args:
+        path: Path to the name cache JSON file
+    """
+    global _name_cache_path
+    try:
+        data = read_json_file(path)
+    except FileNotFoundError:
+        data = {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"Could not read name cache {path}: {e}")
+        data = {}
+    
+    now = time.time()
+    skipped = 0
+    try:
+        for kind, cache in _PERSISTED_CACHES.items():
+            entries = data.get(kind) if isinstance(data, dict) else None
+            if not isinstance(entries, dict):
+                continue
+            for key, value in entries.items():
+                try:
+                    name, fetched_at = value
+                    if not isinstance(name, str):
+                        raise TypeError(f"name is {type(name).__name__}")
+                    if now - fetched_at < NAME_CACHE_MAX_AGE:
+                        cache[key] = name
+                        _cache_timestamps[key] = now
+                        _name_fetch_times[kind][key] = fetched_at
+                except (TypeError, ValueError):
+                    skipped += 1
+        if skipped:
+            logging.warning(f"Skipped {skipped} malformed entries in name cache {path}")
+    finally:
+        with _name_cache_lock:
+            _name_cache_path = path
+
+def shutdown_name_fetch_pool() -> None:
+    """Drop queued name lookups and stop accepting new ones (called on quit)."""
+    name_fetch_pool.shutdown(wait=False, cancel_futures=True)
+
+def save_name_cache() -> None:
+    """Write known video titles and channel names to the persistent cache (no-op before load_name_cache)."""
+    global _unsaved_names
+    with _name_cache_lock:
+        if not _name_cache_path:
+            return
+        _unsaved_names = 0
+        # get() rather than indexing: an entry can disappear from the cache meanwhile
+        data = {
+            kind: {
+                key: [name, fetched_at]
+                for key, fetched_at in list(_name_fetch_times[kind].items())
+                if (name := cache.get(key)) is not None
+            }
+            for kind, cache in _PERSISTED_CACHES.items()
+        }
+        try:
+            write_json_atomic(_name_cache_path, data, durable=False, indent=None)
+        except OSError as e:
+            logging.warning(f"Could not save name cache {_name_cache_path}: {e}")
+
 def get_video_title_fast(video_id: str) -> str:
     """
     Get video title using YouTube oEmbed API (much faster than yt_dlp).
@@ -55,20 +225,16 @@ def get_video_title_fast(video_id: str) -> str:
         # Use YouTube oEmbed API - much faster than yt_dlp
         oembed_url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={video_id}&format=json"
         
-        # Use session for connection pooling and better performance
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        
-        response = session.get(oembed_url, timeout=3)  # Reduced timeout for faster failure
+        response = _http_session.get(oembed_url, timeout=3)  # Reduced timeout for faster failure
         response.raise_for_status()
         
         data = response.json()
-        title = data.get('title', 'Unknown Video')
+        title = data.get('title')
+        if not title:
+            return 'Unknown Video'  # Not cached, so the next lookup tries again
         
         # Cache the result
-        _set_cache(video_id, title, _video_title_cache)
+        _remember_name("videos", video_id, title)
         return title
         
     except Exception as e:
@@ -76,12 +242,12 @@ def get_video_title_fast(video_id: str) -> str:
         # Fallback to yt_dlp if oEmbed fails
         try:
             url = f"https://www.youtube.com/watch?v={video_id}"
-            ydl_opts = {'quiet': True, 'extract_flat': True}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                title = info.get('title', 'Unknown Video')
-                _set_cache(video_id, title, _video_title_cache)
-                return title
+            info = _extract_info("flat", url)
+            title = info.get('title')
+            if not title:
+                return 'Unknown Video'
+            _remember_name("videos", video_id, title)
+            return title
         except Exception:
             return 'Unknown Video'
 
@@ -89,6 +255,9 @@ def get_channel_name_fast(channel_id: str) -> str:
     """
     Get channel name using lightweight web scraping (faster than yt_dlp).
     
+    Safe to call from several threads: the yt_dlp fallback runs on a shared
+    YoutubeDL instance that is only used under its own lock (see _extract_info).
+    
     Args:
         channel_id: YouTube channel ID
         
@@ -104,13 +273,7 @@ def get_channel_name_fast(channel_id: str) -> str:
         # Try to get channel name from channel page
         url = f"https://www.youtube.com/channel/{channel_id}"
         
-        # Use session for connection pooling and better performance
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        
-        response = session.get(url, timeout=5)  # Reduced timeout
+        response = _http_session.get(url, timeout=5)  # Reduced timeout
         response.raise_for_status()
         
         # Look for channel name in page title or meta tags
@@ -123,14 +286,14 @@ def get_channel_name_fast(channel_id: str) -> str:
             # Remove " - YouTube" suffix if present
             channel_name = title.replace(' - YouTube', '').strip()
             if channel_name and channel_name != 'YouTube':
-                _set_cache(channel_id, channel_name, _channel_name_cache)
+                _remember_name("channels", channel_id, channel_name)
                 return channel_name
         
         # Try to extract from JSON-LD structured data
         json_ld_match = re.search(r'"name":\s*"([^"]+)"', content)
         if json_ld_match:
             channel_name = json_ld_match.group(1)
-            _set_cache(channel_id, channel_name, _channel_name_cache)
+            _remember_name("channels", channel_id, channel_name)
             return channel_name
             
     except Exception as e:
@@ -139,12 +302,12 @@ def get_channel_name_fast(channel_id: str) -> str:
     # Fallback to yt_dlp if web scraping fails
     try:
         url = f"https://www.youtube.com/channel/{channel_id}"
-        ydl_opts = {"quiet": True, "no_warnings": True, "skip_download": True}
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            channel_name = info.get("uploader", "Unknown Channel")
-            _set_cache(channel_id, channel_name, _channel_name_cache)
-            return channel_name
+        info = _extract_info("channel", url)
+        channel_name = info.get("channel") or info.get("uploader") or info.get("title")
+        if not channel_name:
+            return "Unknown Channel"  # Not cached, so the next lookup tries again
+        _remember_name("channels", channel_id, channel_name)
+        return channel_name
     except Exception:
         return "Unknown Channel"
 
@@ -166,10 +329,7 @@ def get_video_title(youtube_url: str) -> str:
         return get_video_title_fast(video_id)
     
     # Fallback to yt_dlp for non-standard URLs
-    ydl_opts = {'quiet': True, 'extract_flat': True}
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(youtube_url, download=False)
-        return info['title']
+    return _extract_info("flat", youtube_url)['title']
 
 def get_video_name_fromID(video_id: str) -> str:
     """
@@ -183,6 +343,51 @@ def get_video_name_fromID(video_id: str) -> str:
     """
     return get_video_title_fast(video_id)
 
+def resolve_audio(youtube_url: str) -> Tuple[str, str]:
+    """
+    Get the direct audio stream URL and title from a single yt_dlp extraction.
+    
+    Results are cached until shortly before the stream URL expires (see
+    _audio_cache_expiry), and the title is also stored in the title cache so
+    later lookups by video ID skip the network.
+    
+    Args:
+        youtube_url: Full YouTube URL
+        
+    Returns:
+        Tuple[str, str]: (direct audio stream URL for VLC playback, video title)
+    """
+    cached = _audio_cache.get(youtube_url)
+    if cached and time.time() < cached[0]:
+        return cached[1], cached[2]
+    
+    info = _extract_info("audio", youtube_url)
+    
+    direct_url = info['url']
+    title = info.get('title', 'Unknown Video')
+    now = time.time()
+    if len(_audio_cache) >= AUDIO_CACHE_MAX_ENTRIES:
+        _prune_audio_cache(now)
+    _audio_cache[youtube_url] = (_audio_cache_expiry(direct_url, now), direct_url, title)
+    if info.get('id') and info.get('title'):
+        _remember_name("videos", info['id'], title)
+    return direct_url, title
+
+def _audio_cache_expiry(direct_url: str, now: float) -> float:
+    """Return when a resolved stream URL should stop being reused."""
+    match = _STREAM_EXPIRE_RE.search(direct_url)
+    if match:
+        return max(now, int(match.group(1)) - AUDIO_EXPIRY_MARGIN)
+    return now + AUDIO_CACHE_DURATION
+
+def _prune_audio_cache(now: float) -> None:
+    """Drop expired streams, then the oldest ones if the cache is still full."""
+    for url, entry in list(_audio_cache.items()):
+        if entry[0] <= now:
+            _audio_cache.pop(url, None)
+    while len(_audio_cache) >= AUDIO_CACHE_MAX_ENTRIES:
+        _audio_cache.pop(next(iter(_audio_cache)), None)
+
 def get_direct_url(youtube_url: str) -> str:
     """
     Get direct audio stream URL from YouTube URL.
@@ -193,10 +398,7 @@ def get_direct_url(youtube_url: str) -> str:
     Returns:
         str: Direct audio stream URL for VLC playback
     """
-    ydl_opts = {'format': 'bestaudio'}
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(youtube_url, download=False)
-        return info['url']
+    return resolve_audio(youtube_url)[0]
 
 def fetch_channel_name(channel_id: str) -> str:
     """
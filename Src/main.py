@@ -13,12 +13,13 @@ import json
 import logging
 import os
 import re
+import sys
 import threading
-import time
 import traceback
-from collections import defaultdict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from time import time as current_time
+from time import monotonic
 import webbrowser
 
 
@@ -35,31 +36,41 @@ from watchdog.events import FileSystemEventHandler  # File system event handling
 # Local Imports
 from settings import Settings
 from helpers.moderation_helpers import (
+    ModerationEntry,
+    init_moderation_db,
+    close_moderation_db,
     load_banned_users,
     load_banned_ids,
     load_whitelisted_users,
     load_whitelisted_ids,
-    save_banned_users,
-    save_banned_ids,
-    save_whitelisted_users,
-    save_whitelisted_ids
+    add_entry,
+    has_entry,
+    get_data_version,
+    BANNED_USERS_TABLE,
+    BANNED_IDS_TABLE,
+    WHITELISTED_USERS_TABLE,
+    WHITELISTED_IDS_TABLE
 )
 from helpers.currency_helpers import (
     convert_to_usd
 )
 from helpers.youtube_helpers import (
-    get_video_title,
     get_video_name_fromID,
-    get_direct_url,
-    fetch_channel_name
+    resolve_audio,
+    fetch_channel_name,
+    load_name_cache,
+    save_name_cache,
+    shutdown_name_fetch_pool
 )
 from helpers.time_helpers import (
-    format_time
+    format_time,
+    CachedTimeFormatter
 )
 from helpers.file_helpers import (
     get_app_folder,
     ensure_file_exists,
     ensure_json_valid,
+    parse_json,
     show_folder
 )
 from helpers.update_helpers import (
@@ -101,6 +112,10 @@ os.makedirs(LOG_FOLDER, exist_ok=True)
 
 # Configuration file paths
 CONFIG_PATH = os.path.join(APP_FOLDER, 'config.json')
+MODERATION_DB_PATH = os.path.join(APP_FOLDER, 'moderation.db')
+NAME_CACHE_PATH = os.path.join(APP_FOLDER, 'name_cache.json')
+
+# Legacy moderation list files (imported into MODERATION_DB_PATH on first run)
 BANNED_IDS_PATH = os.path.join(APP_FOLDER, 'banned_IDs.json')
 BANNED_USERS_PATH = os.path.join(APP_FOLDER, 'banned_users.json')
 WHITELISTED_IDS_PATH = os.path.join(APP_FOLDER, 'whitelisted_IDs.json')
@@ -110,9 +125,6 @@ WHITELISTED_USERS_PATH = os.path.join(APP_FOLDER, 'whitelisted_users.json')
 THEMES_FOLDER = os.path.join(APP_FOLDER, 'themes')
 init_theme_system(THEMES_FOLDER)
 
-# close gui
-closeGui = False
-
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -120,12 +132,15 @@ closeGui = False
 # Create timestamped log file
 log_filename = os.path.join(LOG_FOLDER, f"app_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log")
 
-# Configure logging with both file and console output
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configure logging with both file and console output. All handlers (including
+# the GUI console) share one formatter, so timestamps are formatted once per second.
+log_formatter = CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s')
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(log_formatter)
 file_handler = logging.FileHandler(log_filename)
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+file_handler.setFormatter(log_formatter)
 file_handler.setLevel(logging.INFO)
-logging.getLogger().addHandler(file_handler)
+logging.basicConfig(level=logging.INFO, handlers=[console_handler, file_handler])
 
 # Suppress noisy third-party library logs
 logging.getLogger("urllib3").setLevel(logging.ERROR)
@@ -139,22 +154,35 @@ logging.getLogger('yt_dlp').setLevel(logging.ERROR)
 
 # GUI state variables
 last_user_seek_time = 0
+last_now_playing_text = ""  # Last text sent to the Now Playing label
+current_song_length = None  # Length (s) of the current track, cached by playback_ticker_thread
 
 # Application control
-should_exit = False
+should_exit = threading.Event()  # Set once to stop all background threads
+chat = None  # pytchat client for the current livestream (set by initialize_chat)
+
+# Signalled by VLC/queue events so background threads wake only when something changed
+song_ended = threading.Event()           # Playlist reached its end
+now_playing_changed = threading.Event()  # Current track changed or playback stopped
+update_detected = threading.Event()      # Update check found a newer version
+track_changed = threading.Event()        # VLC switched media; cached track length is stale
+queue_history_changed = threading.Event()  # QUEUE_HISTORY grew; the history window needs a refresh
+gui_ready = threading.Event()            # GUI_BRIDGE and the main window exist (set by run_gui)
 
 # =============================================================================
 # CONFIGURATION MANAGEMENT
 # =============================================================================
 
 # Global data structures for banned/whitelisted users and videos
-BANNED_USERS: list[dict] = []  # {"id": "UCxxxx", "name": "ChannelName"}
-BANNED_IDS: list[dict] = []    # {"id": "xxxxxx", "name": "VideoName"}
-WHITELISTED_USERS: list[dict] = []  # {"id": "UCxxxx", "name": "ChannelName"}
-WHITELISTED_IDS: list[dict] = []    # {"id": "xxxxxx", "name": "VideoName"}
+BANNED_USERS: dict[str, ModerationEntry] = {}       # "UCxxxx" -> ModerationEntry("UCxxxx", "ChannelName")
+BANNED_IDS: dict[str, ModerationEntry] = {}         # "xxxxxx" -> ModerationEntry("xxxxxx", "VideoName")
+WHITELISTED_USERS: dict[str, ModerationEntry] = {}  # "UCxxxx" -> ModerationEntry("UCxxxx", "ChannelName")
+WHITELISTED_IDS: dict[str, ModerationEntry] = {}    # "xxxxxx" -> ModerationEntry("xxxxxx", "VideoName")
+moderation_lists_version = 0  # Bumped when a reload changes any of the lists above
+moderation_data_version = None  # get_data_version() when the lists above were last read
 
 # Queue history - stores past queued songs (resets on app restart)
-QUEUE_HISTORY: list[dict] = []  # [{"user_id": "UCxxxx", "username": "Name", "song_id": "xxxxxx", "song_title": "Title"}]
+QUEUE_HISTORY: list[dict] = []  # [{"user_id": "UCxxxx", "username": "Name", "song_id": "xxxxxx", "song_title": "Title", "display": "Title - Requested by ..."}]
 
 # Update detection state
 UPDATE_AVAILABLE: bool = False
@@ -178,20 +206,20 @@ GUI_MAIN_WINDOW_REF = []
 default_config = {
     "YOUTUBE_VIDEO_ID": "LIVESTREAM_ID",      # YouTube livestream ID to monitor
     "RATE_LIMIT_SECONDS": 3000,               # Cooldown between user requests (seconds)
-    "TOAST_NOTIFICATIONS": "True",            # Enable desktop notifications
+    "TOAST_NOTIFICATIONS": True,              # Enable desktop notifications
     "PREFIX": "!",                            # Command prefix for chat messages
     "QUEUE_COMMAND": "queue",                 # Command name for queuing songs
     "VOLUME": 50,                             # Default volume level (0-100)
     "THEME": "dark_theme",                    # Theme name
-    "ALLOW_URLS": "False",                    # Allow full YouTube URLs in requests
-    "REQUIRE_MEMBERSHIP": "False",            # Require channel membership to request
-    "REQUIRE_SUPERCHAT": "False",             # Require superchat to request
+    "ALLOW_URLS": False,                      # Allow full YouTube URLs in requests
+    "REQUIRE_MEMBERSHIP": False,              # Require channel membership to request
+    "REQUIRE_SUPERCHAT": False,               # Require superchat to request
     "MINIMUM_SUPERCHAT": 3,                   # Minimum superchat value in USD
-    "ENFORCE_ID_WHITELIST": "False",          # Only allow whitelisted video IDs
-    "ENFORCE_USER_WHITELIST": "False",        # Only allow whitelisted users
-    "AUTOREMOVE_SONGS": "True",               # Auto-remove finished songs from queue
-    "AUTOBAN_USERS": "False",                 # Auto-ban users who request banned videos
-    "SONG_FINISH_NOTIFICATIONS": "False",     # Notify when songs finish naturally (not skipped)
+    "ENFORCE_ID_WHITELIST": False,            # Only allow whitelisted video IDs
+    "ENFORCE_USER_WHITELIST": False,          # Only allow whitelisted users
+    "AUTOREMOVE_SONGS": True,                 # Auto-remove finished songs from queue
+    "AUTOBAN_USERS": False,                   # Auto-ban users who request banned videos
+    "SONG_FINISH_NOTIFICATIONS": False,       # Notify when songs finish naturally (not skipped)
     "IGNORED_VERSION": ""                     # Version to ignore when checking for updates  
 }
 
@@ -201,10 +229,6 @@ default_config = {
 
 # Ensure all required files exist with default content
 ensure_file_exists(CONFIG_PATH, default_config)
-ensure_file_exists(BANNED_IDS_PATH, [])
-ensure_file_exists(BANNED_USERS_PATH, [])
-ensure_file_exists(WHITELISTED_IDS_PATH, [])
-ensure_file_exists(WHITELISTED_USERS_PATH, [])
 
 # Validate and clean configuration files
 ensure_json_valid(CONFIG_PATH, default_config)
@@ -216,15 +240,24 @@ Settings.load()
 # Set theme from Settings
 set_current_theme(Settings.THEME)
 
-# Load configuration data from files
-with open(BANNED_IDS_PATH, 'r', encoding="utf-8") as f:
-    BANNED_IDS = json.load(f)
-with open(BANNED_USERS_PATH, "r", encoding="utf-8") as f:
-    BANNED_USERS = json.load(f)
-with open(WHITELISTED_IDS_PATH, 'r', encoding="utf-8") as f:
-    WHITELISTED_IDS = json.load(f)
-with open(WHITELISTED_USERS_PATH, "r", encoding="utf-8") as f:
-    WHITELISTED_USERS = json.load(f)
+# Open the moderation database (imports the legacy JSON lists on first run)
+init_moderation_db(MODERATION_DB_PATH, {
+    BANNED_IDS_TABLE: BANNED_IDS_PATH,
+    BANNED_USERS_TABLE: BANNED_USERS_PATH,
+    WHITELISTED_IDS_TABLE: WHITELISTED_IDS_PATH,
+    WHITELISTED_USERS_TABLE: WHITELISTED_USERS_PATH,
+})
+
+# Load video titles seen in earlier sessions. Nothing looks names up before chat
+# polling starts, so the file is parsed while the config dialog is open
+name_cache_loader = threading.Thread(target=load_name_cache, args=(NAME_CACHE_PATH,), daemon=True)
+name_cache_loader.start()
+
+# Load moderation lists from the database
+BANNED_IDS = load_banned_ids()
+BANNED_USERS = load_banned_users()
+WHITELISTED_IDS = load_whitelisted_ids()
+WHITELISTED_USERS = load_whitelisted_users()
 
 # =============================================================================
 # CONFIGURATION VARIABLES (deprecated - use Settings.field instead)
@@ -233,8 +266,19 @@ with open(WHITELISTED_USERS_PATH, "r", encoding="utf-8") as f:
 # Access settings via Settings.field (e.g., Settings.VOLUME, Settings.PREFIX)
 
 
-# User rate limiting - tracks last command time per user
-user_last_command = defaultdict(lambda: 0)
+# User rate limiting - last accepted command time per user, oldest first.
+# Entries older than RATE_LIMIT_SECONDS no longer matter and are evicted as new ones arrive.
+user_last_command: OrderedDict[str, float] = OrderedDict()
+rate_limit_lock = threading.Lock()
+
+# Requests that pass the chat filters are resolved and queued on this pool,
+# so a slow yt_dlp extraction never holds up chat polling. A single worker keeps
+# songs in the order they were requested; extractions share one locked
+# YoutubeDL anyway, so more workers would only race each other to the queue.
+SONG_REQUEST_WORKERS = 1
+# Held while a request adds to the playlist and while quit_program() releases VLC
+vlc_release_lock = threading.Lock()
+song_request_pool = ThreadPoolExecutor(max_workers=SONG_REQUEST_WORKERS, thread_name_prefix="song-request")
 # =============================================================================
 # VLC MEDIA PLAYER SETUP
 # =============================================================================
@@ -243,13 +287,14 @@ def on_next_item(event) -> None:
     """
     Callback function triggered when VLC moves to the next item in the playlist.
     
-    If auto-remove is enabled, this removes the finished song from the queue.
+    If auto-remove is enabled, this flags remove_finished_songs() to drop the
+    songs before the new item, so VLC's event thread never locks the playlist.
     Also handles notifications for the new song starting.
     
     Args:
         event: VLC event object (unused but required by VLC callback signature)
     """
-    global user_initiated_skip, QUEUE_HISTORY
+    global user_initiated_skip, QUEUE_HISTORY, finished_songs
     
     # Check if this was a natural completion (not user-initiated skip)
     is_natural_completion = not user_initiated_skip
@@ -261,35 +306,86 @@ def on_next_item(event) -> None:
     if is_natural_completion and Settings.SONG_FINISH_NOTIFICATIONS:
         try:
             # Get the new song that's now playing
-            media_player = player.get_media_player()
-            if media_player:
-                media = media_player.get_media()
-                if media:
-                    media.parse_with_options(vlc.MediaParseFlag.local, timeout=1000)
-                    new_song_title = media.get_meta(vlc.Meta.Title)
-                    
-                    if new_song_title:
-                        notification.notify(
-                            title="Now Playing",
-                            message=f"'{new_song_title}'",
-                            timeout=5
-                        )
+            media = media_player.get_media()
+            if media:
+                new_song_title = media.get_meta(vlc.Meta.Title)
+                
+                if new_song_title:
+                    notification.notify(
+                        title="Now Playing",
+                        message=f"'{new_song_title}'",
+                        timeout=5
+                    )
         except Exception as e:
             logging.error(f"Error showing new song notification: {e}")
     
     if Settings.AUTOREMOVE_SONGS:
+        # The removal itself runs on playback_ticker_thread (see remove_finished_songs)
+        with finished_songs_lock:
+            finished_songs += 1
+
+    now_playing_changed.set()
+
+def remove_finished_songs() -> None:
+    """
+    Remove the songs VLC has moved past from the front of the queue.
+    
+    Runs on playback_ticker_thread: VLC must not be controlled from its own
+    callbacks, so on_next_item only records that the item changed. The count
+    is not used as the number to remove, since VLC also sends NextItemSet when
+    playback first starts. Instead every entry before the media now playing is
+    removed, in one critical section.
+    """
+    global finished_songs
+    with finished_songs_lock:
+        pending, finished_songs = finished_songs, 0
+    if not pending:
+        return
+    try:
+        media_list.lock()
         try:
-            # Always remove the first item (the one that just finished)
-            if media_list.count() > 1:
-                media_list.lock()
+            count = media_list.count()
+            current = media_player.get_media()
+            # -1 if the current media is not (or no longer) in the queue
+            removed = max(0, media_list.index_of_item(current)) if current else 0
+            for _ in range(removed):
                 media_list.remove_index(0)
-                media_list.unlock()
-                logging.info("Removed finished song from queue")
-            if media_list.count() == 0:
-                logging.info("Queue empty - stopping player")
-                player.stop()
-        except Exception as e:
-            logging.error(f"Error removing finished song: {e}")
+            count -= removed
+        finally:
+            media_list.unlock()
+        if removed:
+            logging.info("Removed %d finished song(s) from queue", removed)
+        if count == 0:
+            logging.info("Queue empty - stopping player")
+            player.stop()
+    except Exception as e:
+        logging.error(f"Error removing finished song: {e}")
+
+def on_playlist_ended(event) -> None:
+    """
+    Callback function triggered when VLC reaches the end of the playlist or a track.
+    
+    VLC must not be controlled from inside its own callbacks, so this only flags the
+    event for playback_ticker_thread.
+    
+    Args:
+        event: VLC event object (unused but required by VLC callback signature)
+    """
+    song_ended.set()
+    now_playing_changed.set()
+
+def on_player_stopped(event) -> None:
+    """Callback for MediaPlayerStopped: refresh the 'Now Playing' display."""
+    now_playing_changed.set()
+
+def on_media_changed(event) -> None:
+    """Callback for MediaPlayerMediaChanged: invalidate the cached track length."""
+    track_changed.set()
+
+# NextItemSet events since the last ticker tick (counted by on_next_item);
+# non-zero means remove_finished_songs() should drop the items before the current one
+finished_songs = 0
+finished_songs_lock = threading.Lock()
 
 # Initialize VLC media player components
 instance = vlc.Instance("--one-instance") # Prevent multiple VLC instances
@@ -297,36 +393,59 @@ player = instance.media_list_player_new()  # Create playlist player
 media_list = instance.media_list_new()     # Create empty playlist
 player.set_media_list(media_list)          # Assign playlist to player
 player.play()                              # Start the player
-player.get_media_player().audio_set_volume(Settings.VOLUME)  # Set initial volume
+# The list player keeps one media player for its whole lifetime. Every
+# get_media_player() call returns a new reference, so fetch it once here and
+# release it in quit_program().
+media_player = player.get_media_player()
+media_player.audio_set_volume(Settings.VOLUME)  # Set initial volume
 
 # Set up event handling for automatic song removal
 event_manager = player.event_manager()
 event_manager.event_attach(vlc.EventType.MediaListPlayerNextItemSet, on_next_item)
+event_manager.event_attach(vlc.EventType.MediaListPlayerPlayed, on_playlist_ended)
+media_player_events = media_player.event_manager()
+media_player_events.event_attach(vlc.EventType.MediaPlayerEndReached, on_playlist_ended)
+media_player_events.event_attach(vlc.EventType.MediaPlayerStopped, on_player_stopped)
+media_player_events.event_attach(vlc.EventType.MediaPlayerMediaChanged, on_media_changed)
 logging.info("Started VLC media player...")
 
 # =============================================================================
 # DATA MANAGEMENT FUNCTIONS
 # =============================================================================
 
+def _reload_moderation_list(entries: dict, loaded: dict) -> None:
+    """
+    Replace the contents of an in-memory moderation list in place.
+    
+    The dict object is kept, so windows and background name fetches holding
+    a reference to it see the reloaded entries instead of a stale copy. If
+    the database holds the same entries, nothing is replaced and open windows
+    need no rebuild (see moderation_lists_version).
+    """
+    global moderation_lists_version
+    if entries.keys() == loaded.keys() and all(
+        entries[entry_id].name == entry.name for entry_id, entry in loaded.items()
+    ):
+        return
+    entries.clear()
+    entries.update(loaded)
+    moderation_lists_version += 1
+
 def load_banned_users_wrapper() -> None:
-    """Load banned users list from file and update global variable."""
-    global BANNED_USERS
-    BANNED_USERS = load_banned_users(BANNED_USERS_PATH)
+    """Load banned users list from the moderation database and update global variable."""
+    _reload_moderation_list(BANNED_USERS, load_banned_users())
 
 def load_banned_ids_wrapper() -> None:
-    """Load banned video IDs list from file and update global variable."""
-    global BANNED_IDS
-    BANNED_IDS = load_banned_ids(BANNED_IDS_PATH)
+    """Load banned video IDs list from the moderation database and update global variable."""
+    _reload_moderation_list(BANNED_IDS, load_banned_ids())
 
 def load_whitelisted_users_wrapper() -> None:
-    """Load whitelisted users list from file and update global variable."""
-    global WHITELISTED_USERS
-    WHITELISTED_USERS = load_whitelisted_users(WHITELISTED_USERS_PATH)
+    """Load whitelisted users list from the moderation database and update global variable."""
+    _reload_moderation_list(WHITELISTED_USERS, load_whitelisted_users())
 
 def load_whitelisted_ids_wrapper() -> None:
-    """Load whitelisted video IDs list from file and update global variable."""
-    global WHITELISTED_IDS
-    WHITELISTED_IDS = load_whitelisted_ids(WHITELISTED_IDS_PATH)
+    """Load whitelisted video IDs list from the moderation database and update global variable."""
+    _reload_moderation_list(WHITELISTED_IDS, load_whitelisted_ids())
 
 def load_settings_wrapper() -> None:
     """Load settings from config file and update global variables."""
@@ -354,6 +473,7 @@ def check_for_updates_wrapper() -> None:
             LATEST_RELEASE_DETAILS = fetch_latest_release_details() or {}
         except Exception:
             LATEST_RELEASE_DETAILS = {}
+        update_detected.set()
 
         # If the GUI exists, surface UI immediately
         try:
@@ -374,21 +494,13 @@ def rebuild_theme_menu_items() -> None:
 
 def reload_themes() -> None:
     """Reload all themes from disk."""
+    from gui.theme_engine import clear_qss_cache
+    clear_qss_cache()
     unload_all_themes()
     load_all_themes()
     apply_theme(get_current_theme())
 
 
-def _reload_themes_with_menu_refresh() -> None:
-    """Reload themes and rebuild theme menu (for file watcher / live reload)."""
-    if GUI_MAIN_WINDOW_REF:
-        try:
-            GUI_MAIN_WINDOW_REF[0]._do_reload_themes()
-        except (AttributeError, IndexError):
-            reload_themes()
-    else:
-        reload_themes()
-
 # =============================================================================
 # THEME FILE WATCHER
 # =============================================================================
@@ -396,12 +508,9 @@ def _reload_themes_with_menu_refresh() -> None:
 class ThemeFileHandler(FileSystemEventHandler):
     """
     File system event handler for theme files.
-    Uses QTimer.singleShot to run reload on GUI thread (thread-safe).
+    Runs on the watchdog thread, so reloads are requested via GUI_BRIDGE and run on the GUI thread.
+    Every relevant event is forwarded; MainWindow debounces them into one reload.
     """
-    def __init__(self):
-        super().__init__()
-        self.last_reload_time = 0
-        self.reload_debounce_seconds = 0.5  # Debounce rapid file changes
 
     def on_any_event(self, event):
         """
@@ -419,21 +528,11 @@ class ThemeFileHandler(FileSystemEventHandler):
         if path.endswith('.json.demo') or path.endswith('.qss.example'):
             return
         
-        # Debounce rapid changes (editors may trigger multiple events; Windows can fire before write completes)
-        current_time = time.time()
-        if current_time - self.last_reload_time < self.reload_debounce_seconds:
-            return
-        
-        # Schedule theme reload on GUI thread (thread-safe). 300ms delay helps Windows: file may not be fully written yet.
-        if event.event_type in ('created', 'modified', 'deleted', 'moved'):
-            self.last_reload_time = current_time
-            try:
-                from PySide6.QtCore import QTimer
-                QTimer.singleShot(300, _reload_themes_with_menu_refresh)
-                logging.info(f"Theme file change detected: {os.path.basename(path)} ({event.event_type}), reloading in 0.3s...")
-            except Exception:
-                if GUI_BRIDGE:
-                    GUI_BRIDGE.request_theme_reload.emit()
+        # Hand the reload to the GUI thread; a QTimer started on this thread would
+        # never fire, as the watchdog thread has no Qt event loop
+        if event.event_type in ('created', 'modified', 'deleted', 'moved') and GUI_BRIDGE:
+            GUI_BRIDGE.request_theme_reload.emit()
+            logging.debug(f"Theme file change detected: {os.path.basename(path)} ({event.event_type})")
 
 # Global observer instance for theme file watching
 theme_observer = None
@@ -454,6 +553,8 @@ def start_theme_file_watcher() -> None:
 
     try:
         event_handler = ThemeFileHandler()
+        # The platform's native observer (inotify/FSEvents/ReadDirectoryChangesW);
+        # watchdog only falls back to polling where none is available
         theme_observer = Observer()
         theme_observer.schedule(event_handler, THEMES_FOLDER, recursive=False)
         theme_observer.start()
@@ -500,17 +601,14 @@ def initialize_chat() -> bool:
     try:
         # Clean up any existing chat object before creating a new one
         # This prevents issues when switching from a regular video to a live video
-        try:
-            if 'chat' in globals():
-                old_chat = globals()['chat']
-                if old_chat is not None:
-                    try:
-                        if hasattr(old_chat, 'terminate'):
-                            old_chat.terminate()
-                    except Exception:
-                        pass
-        except (KeyError, AttributeError):
-            pass
+        if chat is not None:
+            try:
+                chat.terminate()
+            except Exception:
+                pass
+            chat = None
+        # pytchat follows YouTube's continuation tokens, so each get() only
+        # returns messages newer than the previous batch
         chat = pytchat.create(video_id=Settings.YOUTUBE_VIDEO_ID)
         return True
     except Exception as e:
@@ -518,26 +616,33 @@ def initialize_chat() -> bool:
         logging.critical(f"Error {traceback.format_exc()}")
         return False
 
-def load_config() -> None:
+def load_config(force: bool = False) -> None:
     """
     Load and parse all configuration files.
     
     Reloads all configuration data from JSON files and updates global variables.
     This function is called when configuration changes are made through the GUI.
+    
+    Args:
+        force: Re-read config.json and the moderation lists even if they have not changed
     """
-    global BANNED_IDS, BANNED_USERS, WHITELISTED_IDS, WHITELISTED_USERS
-
-    # Reload Settings from file
-    Settings.load()
+    global moderation_data_version
+    # Reload Settings from file (skipped when config.json is unchanged)
+    Settings.load(force)
     
     # Update theme if it changed
     set_current_theme(Settings.THEME)
     
-    # Load moderation lists
-    BANNED_IDS = load_banned_ids(BANNED_IDS_PATH)
-    BANNED_USERS = load_banned_users(BANNED_USERS_PATH)
-    WHITELISTED_IDS = load_whitelisted_ids(WHITELISTED_IDS_PATH)
-    WHITELISTED_USERS = load_whitelisted_users(WHITELISTED_USERS_PATH)
+    # Load moderation lists; our own writes already update them in memory, so
+    # they are only re-read when another connection has changed the database
+    data_version = get_data_version()
+    if not force and data_version == moderation_data_version:
+        return
+    moderation_data_version = data_version
+    _reload_moderation_list(BANNED_IDS, load_banned_ids())
+    _reload_moderation_list(BANNED_USERS, load_banned_users())
+    _reload_moderation_list(WHITELISTED_IDS, load_whitelisted_ids())
+    _reload_moderation_list(WHITELISTED_USERS, load_whitelisted_users())
 
 def quit_program() -> None:
     """
@@ -545,27 +650,50 @@ def quit_program() -> None:
     
     Stops all media playback, releases VLC resources, and closes the GUI.
     """
-    global should_exit
-    should_exit = True
+    should_exit.set()
+
+    # Wake background threads blocked on events so they can exit
+    song_ended.set()
+    now_playing_changed.set()
+    update_detected.set()
+    gui_ready.set()
     
     logging.info("Shutting down program")
 
     # Stop theme file watcher
     stop_theme_file_watcher()
 
-    # Clean up VLC resources
+    # Drop song requests that have not started resolving yet
+    song_request_pool.shutdown(wait=False, cancel_futures=True)
+    shutdown_name_fetch_pool()
+
+    # Clean up VLC resources (after any song request that is mid-queue)
     try:
-        player.stop()
-        media_player = player.get_media_player()
-        if media_player:
+        with vlc_release_lock:
+            player.stop()
             media_player.release()
-        player.release()
-        media_list.release()
-        instance.release()
+            player.release()
+            media_list.release()
+            instance.release()
         logging.info("VLC stopped and resources released.")
     except Exception as e:
         logging.error(f"Error releasing VLC resources: {e}")
 
+    # Write out any pending config changes
+    try:
+        Settings.flush()
+    except Exception as e:
+        logging.error(f"Error saving config on exit: {e}")
+
+    # Persist video titles for the next session
+    save_name_cache()
+
+    # Close the moderation database
+    try:
+        close_moderation_db()
+    except Exception as e:
+        logging.error(f"Error closing moderation database: {e}")
+
     # Close GUI (PySide6)
     try:
         from PySide6.QtWidgets import QApplication
@@ -587,11 +715,6 @@ def get_curr_songtime() -> float:
     Returns:
         float: Current time in seconds, or None if no media is playing
     """
-    media_player = player.get_media_player()
-    if media_player is None:
-        logging.warning("No media player found.")
-        return None
-
     current_time_ms = media_player.get_time()
 
     if current_time_ms < 0:
@@ -604,13 +727,16 @@ def get_song_length() -> float:
     """
     Get the total length of the current song.
     
+    Uses the length cached by playback_ticker_thread while the track is
+    unchanged, so seeking does not query VLC on every slider move.
+    
     Returns:
         float: Song length in seconds, or None if no media is loaded
     """
-    media_player = player.get_media_player()
-    if media_player is None:
-        logging.warning("No media player found.")
-        return None
+    length = current_song_length
+    if length is not None and not track_changed.is_set():
+        return length
+
     length_ms = media_player.get_length()
     
     if length_ms <= 0:
@@ -637,38 +763,43 @@ def on_song_slider_change(sender, app_data, user_data) -> None:
     length = get_song_length()
     if length:
         new_time_ms = int(app_data * length * 1000)
-        player.get_media_player().set_time(new_time_ms)
-        last_user_seek_time = current_time()
+        media_player.set_time(new_time_ms)
+        last_user_seek_time = monotonic()
 
-def on_volume_change(sender, app_data, user_data) -> None:
+def on_volume_change(value: int) -> None:
     """
     Handle volume slider changes.
     
+    Only VOLUME changes here, so the save is scheduled directly instead of
+    going through save_config_to_file (which also re-syncs the theme).
+    
     Args:
-        sender: GUI element that triggered the callback (unused)
-        app_data: New volume value (0.0 to 100.0)
-        user_data: Additional user data (unused)
+        value: New volume value (0 to 100)
     """
-    Settings.VOLUME = int(app_data)  # VLC expects volume 0–100
-    player.get_media_player().audio_set_volume(Settings.VOLUME)
-    save_config_to_file()
+    value = int(value)  # VLC expects volume 0–100
+    if value == Settings.VOLUME:
+        return
+    Settings.VOLUME = value
+    media_player.audio_set_volume(value)
+    Settings.schedule_save(durable=False)
 
 # =============================================================================
 # NOTIFICATION FUNCTIONS
 # =============================================================================
 
-def show_toast(video_id: str, username: str) -> None:
+def show_toast(video_id: str, username: str, title: str | None = None) -> None:
     """
     Show desktop notification when a song is queued.
     
     Args:
         video_id: YouTube video ID
         username: Username who requested the song
+        title: Video title if already known (skips the lookup)
     """
     if Settings.TOAST_NOTIFICATIONS:
         notification.notify(
             title="Requested by: " + username,
-            message="Adding '" + get_video_name_fromID(video_id) + "' to queue",
+            message="Adding '" + (title or get_video_name_fromID(video_id)) + "' to queue",
             timeout=5
         )
 
@@ -686,43 +817,78 @@ def queue_song(video_id: str, requester: str, requesterUUID: str) -> None:
         requesterUUID: Unique identifier for the requester
     """
     global QUEUE_HISTORY
+    if should_exit.is_set():
+        return
     youtube_url = "https://music.youtube.com/watch?v=" + video_id
     try:
-        # Get direct audio stream URL
-        direct_url = get_direct_url(youtube_url)
-        media = instance.media_new(direct_url)
-        title = get_video_title(youtube_url)
-        media.set_meta(vlc.Meta.Title, title)
-        media_list.add_media(media)
+        # Get direct audio stream URL and title from one extraction
+        direct_url, title = resolve_audio(youtube_url)
+        # quit_program() releases VLC under vlc_release_lock, so once it has the
+        # lock a request that was still resolving sees should_exit and stops
+        with vlc_release_lock:
+            if should_exit.is_set():
+                return
+            media = instance.media_new(direct_url)
+            media.set_meta(vlc.Meta.Title, title)
+            media_list.lock()  # The playback ticker removes finished songs concurrently
+            try:
+                media_list.add_media(media)
+            finally:
+                media_list.unlock()
+
+            # Start playback if player is stopped
+            state = player.get_state()
+            if state in (vlc.State.Stopped, vlc.State.Ended, vlc.State.NothingSpecial):
+                player.play()
         
         # Add to queue history
         QUEUE_HISTORY.append({
             "user_id": requesterUUID,
             "username": requester,
             "song_id": video_id,
-            "song_title": title
+            "song_title": title,
+            # List label, built once here instead of on every refresh
+            "display": f"{title} - Requested by {requester} ({requesterUUID}) [{video_id}]"
         })
         
-        logging.info(f"Queued: {youtube_url} as {title}. Requested by {requester}, UUID: {requesterUUID}")
-
-        # Start playback if player is stopped
-        state = player.get_state()
-        if state in (vlc.State.Stopped, vlc.State.Ended, vlc.State.NothingSpecial):
-            player.play()
+        logging.info("Queued: %s as %s. Requested by %s, UUID: %s", youtube_url, title, requester, requesterUUID)
+        now_playing_changed.set()
         
         # Show notification
-        show_toast(video_id, requester)
+        show_toast(video_id, requester, title)
         
-        # Refresh queue history window if open
-        refresh_queue_history_list()
+        # Refresh queue history window on the next tick, once per burst of requests
+        queue_history_changed.set()
 
     except Exception as e:
-        logging.warning(f"Error queuing song {youtube_url}: {e}")
+        logging.warning("Error queuing song %s: %s", youtube_url, e)
 
 # =============================================================================
 # CHAT MESSAGE PROCESSING
 # =============================================================================
 
+# Video IDs in chat commands: bare 11-character IDs, and the ID inside a YouTube URL
+VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+VIDEO_URL_ID_RE = re.compile(r"(?:[?&]v=|youtu\.be/|/shorts/)([A-Za-z0-9_-]{11})")
+
+# (PREFIX, QUEUE_COMMAND, trigger) the chat command trigger was last built from
+_queue_trigger = ("", "", "")
+
+def get_queue_trigger() -> str:
+    """
+    Return the chat command trigger (PREFIX + QUEUE_COMMAND).
+    
+    The string is rebuilt only when either setting has been replaced, so the
+    per-message cost is two attribute reads and identity checks.
+    """
+    global _queue_trigger
+    prefix, command, trigger = _queue_trigger
+    if prefix is not Settings.PREFIX or command is not Settings.QUEUE_COMMAND:
+        prefix, command = Settings.PREFIX, Settings.QUEUE_COMMAND
+        trigger = sys.intern(prefix + command)
+        _queue_trigger = (prefix, command, trigger)
+    return trigger
+
 def on_chat_message(chat_message) -> None:
     """
     Process incoming YouTube live chat messages.
@@ -733,93 +899,133 @@ def on_chat_message(chat_message) -> None:
     Args:
         chat_message: Chat message object from pytchat
     """
-    global BANNED_USERS, BANNED_IDS, WHITELISTED_IDS, WHITELISTED_USERS
     message = chat_message.message
+    trigger = get_queue_trigger()
 
     # Only process messages that start with the command prefix
-    if message.startswith(f"{Settings.PREFIX}{Settings.QUEUE_COMMAND}"):
+    if message.startswith(trigger):
         try:
-            # Extract user information
+            # Cheapest checks first: rate limiting and command syntax
             username = chat_message.author.name
-            channelid = chat_message.author.channelId
-            userismember = chat_message.author.isChatSponsor
-            issuperchat = chat_message.type == "superChat"
-            superchatvalue = 0
-
-            # Convert superchat value to USD if applicable
-            if issuperchat:
-                superchatvalue = convert_to_usd(chat_message.amountValue, chat_message.currency)
-
-            current_time = time.time()
+            now = monotonic()  # Elapsed-time clock, unaffected by wall clock changes
+            last_command = user_last_command.get(username)
+            if last_command is not None and now - last_command < Settings.RATE_LIMIT_SECONDS:
+                return
 
-            # Parse command - should be "!queue VIDEO_ID"
-            parts = message.split()
-            if not len(parts) == 2:
+            # Parse command - should be "!queue VIDEO_ID" (stop splitting after the
+            # third word; anything that long is rejected anyway)
+            parts = message.split(None, 2)
+            if len(parts) != 2 or parts[0] != trigger:
                 return
             video_id = parts[1]
 
-            # Check rate limiting
-            if current_time - user_last_command[username] < Settings.RATE_LIMIT_SECONDS:
-                return
+            # Accept a bare video ID, or a YouTube URL if ALLOW_URLS is enabled
+            if not VIDEO_ID_RE.fullmatch(video_id):
+                url_match = VIDEO_URL_ID_RE.search(video_id)
+                if not url_match:
+                    return
+                if not Settings.ALLOW_URLS:
+                    logging.warning("user %s attempted to queue a URL but URL queuing is disabled! (url: %s)", username, video_id)
+                    return
+                video_id = url_match.group(1)
+
+            # Extract user information
+            channelid = chat_message.author.channelId
+            userismember = chat_message.author.isChatSponsor
+            issuperchat = chat_message.type == "superChat"
 
             # Check if video is banned
-            if any(video_id == x["id"] for x in BANNED_IDS):
+            if has_entry(BANNED_IDS_TABLE, video_id):
                 
-                logging.info(f"Blocked user {username} ({channelid}) from queuing song '{get_video_name_fromID(video_id)}' (video is banned)")
+                logging.info("Blocked user %s (%s) from queuing song %s (video is banned)", username, channelid, video_id)
 
-                if Settings.AUTOBAN_USERS:
-                    BANNED_USERS.append({"id": channelid, "name": username})
-                    save_banned_users(BANNED_USERS, BANNED_USERS_PATH)
-                    refresh_banned_users_list()
-                    logging.info(f"Auto-banned user {username} ({channelid}) for requesting banned video")
+                if Settings.AUTOBAN_USERS and not has_entry(BANNED_USERS_TABLE, channelid):
+                    add_entry(BANNED_USERS_TABLE, channelid, username)
+                    entry = BANNED_USERS[channelid] = ModerationEntry(channelid, username)
+                    show_list_entry("banned_users_list", entry)
+                    logging.info("Auto-banned user %s (%s) for requesting banned video", username, channelid)
 
                 return
 
             # Check if user is banned
-            if any(channelid == x["id"] for x in BANNED_USERS):
-                logging.info(f"Blocked user {username} ({channelid}) from queuing song '{get_video_name_fromID(video_id)}' (user is banned)")
+            if has_entry(BANNED_USERS_TABLE, channelid):
+                logging.info("Blocked user %s (%s) from queuing song %s (user is banned)", username, channelid, video_id)
                 return
             
             # Check user whitelist if enforced
-            if (Settings.ENFORCE_USER_WHITELIST and not any(channelid == x["id"] for x in WHITELISTED_USERS)):
-                logging.info(f"Blocked user {username} ({channelid}) from queuing song '{get_video_name_fromID(video_id)}' (user is not whitelisted)")
+            if (Settings.ENFORCE_USER_WHITELIST and not has_entry(WHITELISTED_USERS_TABLE, channelid)):
+                logging.info("Blocked user %s (%s) from queuing song %s (user is not whitelisted)", username, channelid, video_id)
                 return
             
             # Check video whitelist if enforced
-            if (Settings.ENFORCE_ID_WHITELIST and not any(video_id == x["id"] for x in WHITELISTED_IDS)):
-                logging.info(f"Blocked user {username} ({channelid}) from queuing song '{get_video_name_fromID(video_id)}' (video is not whitelisted)")
+            if (Settings.ENFORCE_ID_WHITELIST and not has_entry(WHITELISTED_IDS_TABLE, video_id)):
+                logging.info("Blocked user %s (%s) from queuing song %s (video is not whitelisted)", username, channelid, video_id)
                 return
             
-            # Handle full YouTube URLs if allowed
-            if 'watch?v=' in video_id:
-                if Settings.ALLOW_URLS:
-                    video_id = video_id.split('watch?v=', 1)[1]
-                else:
-                    logging.warning(f"user {username} attempted to queue a URL but URL queuing is disabled! (url: {video_id})")
-                    return
-                
             # Check membership requirement
             if Settings.REQUIRE_MEMBERSHIP and not userismember:
-                logging.warning(f"user {username} attempted to queue a song but they are not a member and 'REQUIRE_MEMBERSHIP' is enabled!")
+                logging.warning("user %s attempted to queue a song but they are not a member and 'REQUIRE_MEMBERSHIP' is enabled!", username)
                 return
 
-            # Check superchat requirement
-            if Settings.REQUIRE_SUPERCHAT and (not issuperchat or superchatvalue < Settings.MINIMUM_SUPERCHAT):
-                logging.warning(f"user {username} attempted to queue a song but their message was not a Superchat or had too low of a value!")
+            # Check superchat requirement (only convert the amount when it matters)
+            if Settings.REQUIRE_SUPERCHAT and (
+                not issuperchat
+                or convert_to_usd(chat_message.amountValue, chat_message.currency) < Settings.MINIMUM_SUPERCHAT
+            ):
+                logging.warning("user %s attempted to queue a song but their message was not a Superchat or had too low of a value!", username)
                 return
 
 
-            if not is_on_youtube_music(video_id):
-                logging.warning(f"user {username} attempted to queue a song that is not available on YouTube Music! (video ID: {video_id})")
-                return
-
-            # All checks passed - queue the song
-            queue_song(video_id, username, channelid)
-            update_now_playing()
-            user_last_command[username] = current_time
+            # All checks passed - claim the rate limit slot now so repeat requests are
+            # rejected while this one resolves, then queue the song in the background
+            record_user_command(username, now)
+            song_request_pool.submit(process_song_request, video_id, username, channelid)
             
         except Exception as e:
             logging.error("Chat message error: %s", e)
+
+def record_user_command(username: str, timestamp: float) -> None:
+    """
+    Record an accepted command for rate limiting and evict expired entries.
+    
+    Entries are kept in timestamp order, so eviction only looks at the stale
+    entries at the front instead of scanning every user ever seen.
+    
+    Args:
+        username: Username who sent the command
+        timestamp: time.monotonic() value when the command was accepted
+    """
+    cutoff = timestamp - Settings.RATE_LIMIT_SECONDS
+    with rate_limit_lock:
+        user_last_command[username] = timestamp
+        user_last_command.move_to_end(username)
+        while user_last_command:
+            oldest_user, oldest_time = next(iter(user_last_command.items()))
+            if oldest_time >= cutoff:
+                break
+            del user_last_command[oldest_user]
+
+def process_song_request(video_id: str, username: str, channelid: str) -> None:
+    """
+    Resolve and queue a chat song request (runs on song_request_pool).
+    
+    Args:
+        video_id: YouTube video ID
+        username: Username who requested the song
+        channelid: Channel ID of the requester
+    """
+    try:
+        if not is_on_youtube_music(video_id):
+            logging.warning(f"user {username} attempted to queue a song that is not available on YouTube Music! (video ID: {video_id})")
+            # Rejected requests do not count against the rate limit (the previous
+            # timestamp had already expired, or this request would not have passed)
+            with rate_limit_lock:
+                user_last_command.pop(username, None)
+            return
+
+        queue_song(video_id, username, channelid)
+    except Exception as e:
+        logging.error(f"Song request error: {e}")
     
 # =============================================================================
 # GUI UPDATE FUNCTIONS
@@ -827,31 +1033,45 @@ def on_chat_message(chat_message) -> None:
 
 def update_now_playing() -> None:
     """
-    Update the 'Now Playing' display in the GUI.
+    Request a refresh of the 'Now Playing' display.
+    
+    Safe to call from any thread (including the GUI thread): the lookup itself
+    runs on playback_ticker_thread, so callers never block on VLC or the network.
+    """
+    now_playing_changed.set()
+
+def refresh_now_playing() -> None:
+    """
+    Look up the current track and send it to the GUI if it changed.
     Uses GUI_BRIDGE when available (PySide6).
     """
-    media = player.get_media_player().get_media()
-    if media:
-        media.parse_with_options(vlc.MediaParseFlag.local, timeout=1000)
-        name = media.get_meta(vlc.Meta.Title)
-        if not name:
-            youtube_url = media.get_mrl()
-            name = get_video_title(youtube_url)
-        text = f"Now Playing: {name}"
-    else:
-        text = "Now Playing: Nothing"
-    if GUI_BRIDGE:
+    global last_now_playing_text
+    # queue_song sets the title on every media item, so no parsing or lookup is needed
+    media = media_player.get_media()
+    name = media.get_meta(vlc.Meta.Title) if media else None
+    text = f"Now Playing: {name or 'Nothing'}"
+    if GUI_BRIDGE and text != last_now_playing_text:
+        last_now_playing_text = text
         GUI_BRIDGE.update_now_playing.emit(text)
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def save_config_to_file() -> None:
-    """Save current configuration to config file."""
+def save_config_to_file(deferred: bool = False) -> None:
+    """
+    Save current configuration to config file.
+    
+    Args:
+        deferred: Coalesce the write on a background timer instead of writing now,
+                  without fsync (use for frequent changes)
+    """
     # Update theme in Settings before saving
     Settings.THEME = get_current_theme()
-    Settings.save()
+    if deferred:
+        Settings.schedule_save(durable=False)
+    else:
+        Settings.save()
 
 def extract_id_from_listbox_item(item: str) -> str:
     """
@@ -863,7 +1083,8 @@ def extract_id_from_listbox_item(item: str) -> str:
     Returns:
         str: Extracted ID
     """
-    return item.split("(")[-1].strip(")")
+    _, _, tail = item.rpartition("(")
+    return tail[:-1] if tail.endswith(")") else tail
 
 def is_on_youtube_music(video_id: str) -> bool:
     return True  # Will add once i find out a way to check properly, I can't find any reliable method as of now
@@ -878,7 +1099,7 @@ def is_youtube_live(video_id):
     m = re.search(r"ytInitialPlayerResponse\s*=\s*(\{.+?\});", html)
     if m:
         try:
-            data = json.loads(m.group(1))
+            data = parse_json(m.group(1))
             if data.get("videoDetails", {}).get("isLive") == True:
                 return True
             # or check data.get("playabilityStatus", {}).get("liveStreamability")
@@ -907,7 +1128,7 @@ def ignore_update_action() -> None:
     UPDATE_AVAILABLE = False
     IGNORED_VERSION = LATEST_VERSION
     Settings.IGNORED_VERSION = IGNORED_VERSION
-    save_config_to_file()
+    Settings.schedule_save()  # Written off the GUI thread; quit_program flushes it
     if GUI_BRIDGE:
         GUI_BRIDGE.hide_update_ui.emit()
 
@@ -921,30 +1142,42 @@ def show_update_details_window() -> None:
 # GUI LIST MANAGEMENT FUNCTIONS
 # =============================================================================
 
+def show_list_entry(list_id: str, entry: ModerationEntry) -> None:
+    """
+    Add or update a single row in a moderation list window without rebuilding the list.
+    
+    Args:
+        list_id: List widget ID (e.g. "banned_users_list")
+        entry: The entry that was added or renamed
+    """
+    if GUI_BRIDGE:
+        GUI_BRIDGE.update_list_item.emit(list_id, entry.id, entry.display)
+
+# The lists are copied before iterating, since the chat thread can add an
+# auto-banned user while a refresh is being built
 def refresh_banned_users_list() -> None:
     """Update the banned users list in the GUI."""
     if GUI_BRIDGE:
-        GUI_BRIDGE.refresh_list.emit("banned_users_list", [f"{u['name']} ({u['id']})" for u in BANNED_USERS])
+        GUI_BRIDGE.refresh_list.emit("banned_users_list", [u.display for u in list(BANNED_USERS.values())])
 
 def refresh_banned_ids_list() -> None:
     """Update the banned video IDs list in the GUI."""
     if GUI_BRIDGE:
-        GUI_BRIDGE.refresh_list.emit("banned_ids_list", [f"{u['name']} ({u['id']})" for u in BANNED_IDS])
+        GUI_BRIDGE.refresh_list.emit("banned_ids_list", [u.display for u in list(BANNED_IDS.values())])
     
 def refresh_whitelisted_users_list() -> None:
     """Update the whitelisted users list in the GUI."""
     if GUI_BRIDGE:
-        GUI_BRIDGE.refresh_list.emit("whitelisted_users_list", [f"{u['name']} ({u['id']})" for u in WHITELISTED_USERS])
+        GUI_BRIDGE.refresh_list.emit("whitelisted_users_list", [u.display for u in list(WHITELISTED_USERS.values())])
 
 def refresh_whitelisted_ids_list() -> None:
     """Update the whitelisted video IDs list in the GUI."""
     if GUI_BRIDGE:
-        GUI_BRIDGE.refresh_list.emit("whitelisted_ids_list", [f"{u['name']} ({u['id']})" for u in WHITELISTED_IDS])
+        GUI_BRIDGE.refresh_list.emit("whitelisted_ids_list", [u.display for u in list(WHITELISTED_IDS.values())])
 
 def refresh_queue_history_list() -> None:
     """Update the queue history list in the GUI."""
-    items = [f"{item['song_title']} - Requested by {item['username']} ({item['user_id']}) [{item['song_id']}]"
-             for item in QUEUE_HISTORY]
+    items = [item["display"] for item in QUEUE_HISTORY]
     if GUI_BRIDGE:
         GUI_BRIDGE.refresh_list.emit("queue_history_list", items)
 
@@ -952,37 +1185,8 @@ def refresh_queue_history_list() -> None:
 # BAN/UNBAN CALLBACK FUNCTIONS
 # =============================================================================
 
-def ban_user_callback() -> None:
-    """Legacy DPG callback - use gui.moderation_windows.BannedUsersWindow."""
-    pass
-
-def ban_id_callback() -> None:
-    """Legacy DPG callback - use gui.moderation_windows.BannedVideosWindow."""
-    pass
-
-def whitelist_user_callback() -> None:
-    """Legacy DPG callback - use gui.moderation_windows.WhitelistedUsersWindow."""
-    pass
-
-def whitelist_id_callback() -> None:
-    """Legacy DPG callback - use gui.moderation_windows.WhitelistedVideosWindow."""
-    pass
-
-def unban_user_callback() -> None:
-    """Legacy DPG callback - use gui.moderation_windows.BannedUsersWindow."""
-    pass
-
-def unban_id_callback() -> None:
-    """Legacy DPG callback - use gui.moderation_windows.BannedVideosWindow."""
-    pass
-
-def unwhitelist_user_callback() -> None:
-    """Legacy DPG callback - use gui.moderation_windows.WhitelistedUsersWindow."""
-    pass
-
-def unwhitelist_id_callback() -> None:
-    """Legacy DPG callback - use gui.moderation_windows.WhitelistedVideosWindow."""
-    pass
+# Adding and removing ban/whitelist entries is handled by one shared path:
+# gui.moderation_windows.ModerationListWindow, configured by MODERATION_WINDOW_SPECS.
 
 def extract_queue_item_info(item: str) -> dict:
     """
@@ -1102,8 +1306,8 @@ def update_theme_menu_checks() -> None:
     pass
 
 def save_theme_to_config() -> None:
-    """Save current theme to config file."""
-    save_config_to_file()
+    """Save current theme to config file (debounced, so rapid theme switches cause a single write)."""
+    save_config_to_file(deferred=True)
 
 def open_url(url: str) -> None:
     """Open a URL in the user's default web browser."""
@@ -1116,85 +1320,128 @@ def open_url(url: str) -> None:
 # BACKGROUND THREADING FUNCTIONS
 # =============================================================================
 
+# Wait between checks while the chat is not alive, growing from min to max
+CHAT_RETRY_MIN_SECONDS = 1.0
+CHAT_RETRY_MAX_SECONDS = 5.0
+
 def poll_chat() -> None:
     """
     Poll YouTube live chat for new messages.
     
     Runs in a background thread to continuously check for new chat messages
-    and process song queue requests.
+    and process song queue requests. Each batch is handled as soon as it is
+    fetched (sync_items() would pace the messages out over the poll interval),
+    then the loop waits out the rest of the interval suggested by YouTube.
+    That interval already adapts to chat activity (shorter on busy chats);
+    while the chat is not alive, the re-check backs off instead.
     """
-    while not should_exit:
+    retry_wait = CHAT_RETRY_MIN_SECONDS
+    while not should_exit.is_set():
+        started = monotonic()
         if chat.is_alive():
-            for message in chat.get().sync_items():
+            retry_wait = CHAT_RETRY_MIN_SECONDS
+            chat_data = chat.get()
+            for message in chat_data.items:
+                # Quit shuts song_request_pool down; drop the rest of the batch
+                if should_exit.is_set():
+                    return
                 on_chat_message(message)
-        time.sleep(1)
+            interval = getattr(chat_data, "interval", None) or CHAT_RETRY_MIN_SECONDS
+        else:
+            interval = retry_wait
+            retry_wait = min(retry_wait * 1.5, CHAT_RETRY_MAX_SECONDS)
+        should_exit.wait(max(0.0, interval - (monotonic() - started)))
 
-def vlc_loop() -> None:
-    """
-    Monitor VLC player state and handle automatic playback.
-    
-    Runs in a background thread to ensure continuous playback when songs end
-    and there are more songs in the queue.
-    """
-    while not should_exit:
-        if player.get_state() == vlc.State.Ended and media_list.count() > 0:
-            player.play()
-        time.sleep(1)
+# Playback ticker cadence: the slider runs every tick, the rest only when signalled
+TICK_SECONDS = 0.1
+FALLBACK_TICKS = 50  # Re-check playback and Now Playing every 5s in case an event was missed
+SLIDER_EMIT_STEPS = 1000  # Song slider's range (setRange(0, 1000)); finer progress changes cannot move it
 
-def update_slider_thread() -> None:
+def playback_ticker_thread() -> None:
     """
-    Update the song progress slider in real-time.
-    Uses GUI_BRIDGE when available (PySide6).
+    Drive all periodic playback work from one background thread.
+    
+    Every TICK_SECONDS the song slider and time text are updated. VLC's
+    end-of-track and track-change events (song_ended, now_playing_changed)
+    are checked on the same tick, so restarting playback and refreshing
+    'Now Playing' need no threads of their own. Songs queued during one tick
+    share a single queue history refresh (queue_history_changed). Every FALLBACK_TICKS both
+    also run unconditionally as a safety net for missed events.
     """
-    while not GUI_BRIDGE and not should_exit:
-        time.sleep(0.1)
-
-    while not should_exit:
-        time.sleep(0.1)
-        media_player = player.get_media_player()
-        if not media_player or not GUI_BRIDGE:
-            continue
+    global current_song_length
+    gui_ready.wait()
+    if should_exit.is_set():
+        return
 
-        curr = get_curr_songtime()
-        total = get_song_length()
-        if curr is None or total is None or total <= 0:
+    total = None
+    total_str = ""
+    last_whole_sec = None  # The time text only changes once per second
+    last_slider_step = None  # Skip emits that would not change the slider's value
+    tick = 0
+
+    refresh_now_playing()
+    while not should_exit.wait(TICK_SECONDS):
+        tick += 1
+        fallback = tick % FALLBACK_TICKS == 0
+
+        # Continue playback when a song ended and more are queued. VLC must not be
+        # controlled from its own callbacks, so on_playlist_ended only sets the event.
+        if song_ended.is_set() or fallback:
+            song_ended.clear()
+            if player.get_state() == vlc.State.Ended and media_list.count() > 0:
+                player.play()
+
+        if finished_songs:
+            remove_finished_songs()
+
+        if now_playing_changed.is_set() or fallback:
+            now_playing_changed.clear()
+            refresh_now_playing()
+
+        if queue_history_changed.is_set():
+            queue_history_changed.clear()
+            refresh_queue_history_list()
+
+        # Track length only changes with the track; VLC reports 0 until it is known
+        if track_changed.is_set():
+            track_changed.clear()
+            total = current_song_length = None
+        if total is None:
+            length_ms = media_player.get_length()
+            if length_ms <= 0:
+                continue
+            total = current_song_length = length_ms / 1000
+            total_str = format_time(total)
+            last_whole_sec = None
+            last_slider_step = None
+
+        curr_ms = media_player.get_time()
+        if curr_ms < 0:
             continue
+        curr = curr_ms / 1000
 
-        time_text = f"{format_time(curr)} / {format_time(total)}"
-        GUI_BRIDGE.update_time_text.emit(time_text)
+        whole_sec = curr_ms // 1000
+        if whole_sec != last_whole_sec:
+            last_whole_sec = whole_sec
+            GUI_BRIDGE.update_time_text.emit(f"{format_time(curr)} / {total_str}")
 
-        if current_time() - last_user_seek_time > 1.0:
+        if monotonic() - last_user_seek_time > 1.0:
             progress = curr / total
-            GUI_BRIDGE.update_slider.emit(progress)
-
-def update_now_playing_thread() -> None:
-    """
-    Update the 'Now Playing' display periodically.
-    
-    Runs in a background thread to keep the current song information
-    displayed in the GUI up to date.
-    """
-    while not should_exit:
-        update_now_playing()
-        time.sleep(1)
+            slider_step = int(progress * SLIDER_EMIT_STEPS)
+            if slider_step != last_slider_step:
+                last_slider_step = slider_step
+                GUI_BRIDGE.update_slider.emit(progress)
 
 
 def enable_update_menu_thread() -> None:
     """Enable the update details menu and show download UI when an update is detected."""
-    while not should_exit:
-        try:
-            if UPDATE_AVAILABLE and LATEST_VERSION and GUI_BRIDGE:
-                show_download_ui(LATEST_VERSION)
-            time.sleep(1)
-        except Exception:
-            time.sleep(2)
-
-def start_theme_watcher_thread() -> None:
-    """Start the theme file watcher after the GUI is ready."""
-    while not GUI_BRIDGE and not should_exit:
-        time.sleep(0.1)
-    if not should_exit:
-        start_theme_file_watcher()
+    update_detected.wait()
+    gui_ready.wait()
+    try:
+        if not should_exit.is_set() and UPDATE_AVAILABLE and LATEST_VERSION:
+            show_download_ui(LATEST_VERSION)
+    except Exception as e:
+        logging.error(f"Error showing update UI: {e}")
 
 
 # =============================================================================
@@ -1204,10 +1451,14 @@ def start_theme_watcher_thread() -> None:
 from gui.config_window import show_config_dialog
 from gui.app import run_gui
 
+# Check for updates in background while the user fills in the config dialog
+threading.Thread(target=check_for_updates_wrapper, daemon=True).start()
+threading.Thread(target=enable_update_menu_thread, daemon=True).start()
+
 # Show configuration editor first (blocks until user saves or quits)
 invalid_id = False
 not_live = False
-while not should_exit:
+while not should_exit.is_set():
     if not show_config_dialog(invalid_id=invalid_id, not_live=not_live):
         break  # User clicked Quit
 
@@ -1224,24 +1475,20 @@ while not should_exit:
         invalid_id = True
         not_live = False
 
-if should_exit:
-    import sys
+if should_exit.is_set():
     sys.exit(0)
 
-# Load final configuration
-load_config()
+# The loop above already loaded the final configuration before breaking out
 
-# Check for updates in background
-threading.Thread(target=check_for_updates_wrapper, daemon=True).start()
-threading.Thread(target=enable_update_menu_thread, daemon=True).start()
-
-# Start background threads
-threading.Thread(target=vlc_loop, daemon=True).start()
+# Start background threads (chat requests may look up names from the cache)
+name_cache_loader.join()
 threading.Thread(target=poll_chat, daemon=True).start()
-threading.Thread(target=update_slider_thread, daemon=True).start()
-threading.Thread(target=update_now_playing_thread, daemon=True).start()
-threading.Thread(target=start_theme_watcher_thread, daemon=True).start()
+threading.Thread(target=playback_ticker_thread, daemon=True).start()
 
-# Run GUI (blocks until quit)
-import sys
+# Run GUI on the main thread (blocks until quit)
 run_gui(sys.modules['__main__'])
+
+# Closing the main window ends the event loop without going through the Quit
+# menu, so run the same shutdown here unless it already ran
+if not should_exit.is_set():
+    quit_program()
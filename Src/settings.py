@@ -2,17 +2,28 @@
 Settings - Static class for application configuration.
 Thread-safe, JSON-backed settings that can be accessed as Settings.field.
 """
-import json
+import logging
 import threading
+import time
 from pathlib import Path
 from typing import Optional
 
+from helpers.file_helpers import read_json_file, write_json_atomic
+
 
 class Settings:
     """Static settings class Saved to a JSON file."""
     
     _lock = threading.RLock()
     _path: Optional[Path] = None
+    _save_timer: Optional[threading.Timer] = None
+    _save_due: float = 0.0          # time.monotonic() at which the pending save should run
+    _save_durable: bool = False     # whether the pending save should fsync
+    _loaded_mtime_ns: Optional[int] = None  # mtime of the file the current values were read from
+    _saved_data: Optional[dict] = None      # to_dict() as last read from / written to that file
+    
+    # Delay before a scheduled save hits the disk; saves requested in the meantime are coalesced
+    SAVE_DEBOUNCE_SECONDS: float = 0.3
     
     # Configuration fields with defaults
     YOUTUBE_VIDEO_ID: str = ""
@@ -33,101 +44,185 @@ class Settings:
     SONG_FINISH_NOTIFICATIONS: bool = False
     IGNORED_VERSION: str = ""
     
+    _BOOL_STRINGS = {"true": True, "false": False}
+    
+    @staticmethod
+    def _to_bool(value) -> bool:
+        """Convert a stored boolean (native or "True"/"False" string, any case) to bool."""
+        if isinstance(value, str):
+            return Settings._BOOL_STRINGS.get(value.strip().lower(), False)
+        return bool(value)
+    
+    # Field name -> parser applied once at load time, so readers always get native types.
+    # Booleans are written as JSON booleans (older config files store "True"/"False" strings).
+    _FIELD_PARSERS = {
+        "YOUTUBE_VIDEO_ID": str,
+        "RATE_LIMIT_SECONDS": int,
+        "TOAST_NOTIFICATIONS": _to_bool,
+        "PREFIX": str,
+        "QUEUE_COMMAND": str,
+        "VOLUME": int,
+        "THEME": str,
+        "ALLOW_URLS": _to_bool,
+        "REQUIRE_MEMBERSHIP": _to_bool,
+        "REQUIRE_SUPERCHAT": _to_bool,
+        "MINIMUM_SUPERCHAT": int,
+        "ENFORCE_ID_WHITELIST": _to_bool,
+        "ENFORCE_USER_WHITELIST": _to_bool,
+        "AUTOREMOVE_SONGS": _to_bool,
+        "AUTOBAN_USERS": _to_bool,
+        "SONG_FINISH_NOTIFICATIONS": _to_bool,
+        "IGNORED_VERSION": str,
+    }
+    
     @classmethod
     def set_path(cls, path: str) -> None:
         """Set the path to the config.json file."""
         cls._path = Path(path)
     
     @classmethod
-    def load(cls) -> None:
-        """Load settings from JSON file."""
+    def load(cls, force: bool = False) -> None:
+        """
+        Load settings from JSON file.
+        
+        The file is only parsed again when its modification time has changed
+        since the last load, so repeated calls are cheap.
+        
+        Args:
+            force: Re-read the file even if it has not changed
+        """
         if cls._path is None:
             raise ValueError("Settings path not set. Call Settings.set_path() first.")
         
+        # Write out pending changes first so they are not overwritten by stale file contents
+        cls.flush()
+        
         if not cls._path.exists():
             cls.save()
             return
         
         with cls._lock:
-            with open(cls._path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            mtime_ns = cls._path.stat().st_mtime_ns
+            if not force and mtime_ns == cls._loaded_mtime_ns:
+                return
+            
+            data = read_json_file(cls._path)
+            cls._loaded_mtime_ns = mtime_ns
             
-            # Load each field, handling type conversions
+            # Load each known field through its parser; values stored with the wrong
+            # type (e.g. legacy "True" strings) are rewritten in the native format
+            needs_migration = False
             for key, value in data.items():
-                if hasattr(cls, key):
-                    # Handle boolean fields that might be stored as strings
-                    if key in ("TOAST_NOTIFICATIONS", "ALLOW_URLS", "REQUIRE_MEMBERSHIP", 
-                              "REQUIRE_SUPERCHAT", "ENFORCE_ID_WHITELIST", 
-                              "ENFORCE_USER_WHITELIST", "AUTOREMOVE_SONGS", "AUTOBAN_USERS", 
-                              "SONG_FINISH_NOTIFICATIONS"):
-                        if isinstance(value, str):
-                            setattr(cls, key, value.lower() == "true")
-                        else:
-                            setattr(cls, key, bool(value))
-                    else:
-                        setattr(cls, key, value)
+                parse = cls._FIELD_PARSERS.get(key)
+                if parse is None:
+                    continue
+                try:
+                    parsed = parse(value)
+                except (TypeError, ValueError):
+                    logging.warning(f"Ignoring invalid value for {key} in {cls._path}: {value!r}")
+                    continue
+                setattr(cls, key, parsed)
+                if type(parsed) is not type(value):
+                    needs_migration = True
             
-            # Handle migration from DARK_MODE to THEME if needed
+            # Handle migration from DARK_MODE to THEME if needed; the rewrite drops
+            # the legacy string flag so it is not parsed again on every load
             if "DARK_MODE" in data and not hasattr(cls, "_theme_migrated"):
-                dark_mode = data.get("DARK_MODE", "True")
-                if isinstance(dark_mode, str):
-                    cls.THEME = "dark_theme" if dark_mode.lower() == "true" else "light_theme"
-                else:
-                    cls.THEME = "dark_theme" if dark_mode else "light_theme"
+                cls.THEME = "dark_theme" if cls._to_bool(data["DARK_MODE"]) else "light_theme"
                 cls._theme_migrated = True
+                needs_migration = True
+            
+            # The file only matches our values if nothing had to be converted
+            cls._saved_data = None if needs_migration else cls.to_dict()
+            if needs_migration:
+                cls.schedule_save()
     
     @classmethod
-    def save(cls) -> None:
-        """Save current settings to JSON file."""
+    def save(cls, durable: bool = True) -> None:
+        """
+        Save current settings to JSON file.
+        
+        The file is written atomically, so a crash mid-save never leaves a
+        truncated config behind. Nothing is written if the values match what
+        the file already holds and it has not been modified since.
+        
+        Args:
+            durable: fsync before replacing the file (can be skipped for frequent writes like volume changes)
+        """
         if cls._path is None:
             raise ValueError("Settings path not set. Call Settings.set_path() first.")
         
         with cls._lock:
-            with open(cls._path, "w", encoding="utf-8") as f:
-                json.dump(
-                    {
-                        "YOUTUBE_VIDEO_ID": cls.YOUTUBE_VIDEO_ID,
-                        "RATE_LIMIT_SECONDS": cls.RATE_LIMIT_SECONDS,
-                        "TOAST_NOTIFICATIONS": str(cls.TOAST_NOTIFICATIONS),
-                        "PREFIX": cls.PREFIX,
-                        "QUEUE_COMMAND": cls.QUEUE_COMMAND,
-                        "VOLUME": cls.VOLUME,
-                        "THEME": cls.THEME,
-                        "ALLOW_URLS": str(cls.ALLOW_URLS),
-                        "REQUIRE_MEMBERSHIP": str(cls.REQUIRE_MEMBERSHIP),
-                        "REQUIRE_SUPERCHAT": str(cls.REQUIRE_SUPERCHAT),
-                        "MINIMUM_SUPERCHAT": cls.MINIMUM_SUPERCHAT,
-                        "ENFORCE_ID_WHITELIST": str(cls.ENFORCE_ID_WHITELIST),
-                        "ENFORCE_USER_WHITELIST": str(cls.ENFORCE_USER_WHITELIST),
-                        "AUTOREMOVE_SONGS": str(cls.AUTOREMOVE_SONGS),
-                        "AUTOBAN_USERS": str(cls.AUTOBAN_USERS),
-                        "SONG_FINISH_NOTIFICATIONS": str(cls.SONG_FINISH_NOTIFICATIONS),
-                        "IGNORED_VERSION": cls.IGNORED_VERSION,
-                    },
-                    f,
-                    indent=4
-                )
+            data = cls.to_dict()
+            if data == cls._saved_data and cls._file_mtime_ns() == cls._loaded_mtime_ns:
+                return
+            write_json_atomic(cls._path, data, durable, indent=2)
+            # Our own write needs no re-parse on the next load()
+            cls._saved_data = data
+            cls._loaded_mtime_ns = cls._file_mtime_ns()
+    
+    @classmethod
+    def _file_mtime_ns(cls) -> Optional[int]:
+        """Modification time of the config file, or None if it does not exist."""
+        try:
+            return cls._path.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    @classmethod
+    def schedule_save(cls, delay: Optional[float] = None, durable: bool = True) -> None:
+        """
+        Save settings after a short delay on a background thread.
+        
+        Calls made before the timer fires push the deadline back and are
+        coalesced into a single write. A pending timer is reused rather than
+        replaced, so rapid calls (e.g. dragging the volume slider) do not start
+        a new thread each time.
+        
+        Args:
+            delay: Seconds to wait before writing (defaults to SAVE_DEBOUNCE_SECONDS)
+            durable: fsync the write; the pending save is durable if any caller asked for it
+        """
+        if delay is None:
+            delay = cls.SAVE_DEBOUNCE_SECONDS
+        with cls._lock:
+            cls._save_due = time.monotonic() + delay
+            cls._save_durable = cls._save_durable or durable
+            if cls._save_timer is None:
+                cls._start_save_timer(delay)
+    
+    @classmethod
+    def _start_save_timer(cls, delay: float) -> None:
+        """Start the background timer for a pending save (caller holds the lock)."""
+        cls._save_timer = threading.Timer(delay, cls._on_save_timer)
+        cls._save_timer.daemon = True
+        cls._save_timer.start()
+    
+    @classmethod
+    def _on_save_timer(cls) -> None:
+        """Timer callback: write the pending save, or wait longer if the deadline moved."""
+        with cls._lock:
+            # Ignore timers that were flushed or superseded while waiting for the lock
+            if cls._save_timer is not threading.current_thread():
+                return
+            remaining = cls._save_due - time.monotonic()
+            if remaining > 0:
+                cls._start_save_timer(remaining)
+                return
+            cls.flush()
+    
+    @classmethod
+    def flush(cls) -> None:
+        """Write a pending scheduled save immediately (no-op if nothing is pending)."""
+        with cls._lock:
+            if cls._save_timer is None:
+                return
+            cls._save_timer.cancel()
+            cls._save_timer = None
+            durable, cls._save_durable = cls._save_durable, False
+            cls.save(durable)
     
     @classmethod
     def to_dict(cls) -> dict:
-        """Convert settings to dictionary (for backward compatibility)."""
-        return {
-            "YOUTUBE_VIDEO_ID": cls.YOUTUBE_VIDEO_ID,
-            "RATE_LIMIT_SECONDS": cls.RATE_LIMIT_SECONDS,
-            "TOAST_NOTIFICATIONS": str(cls.TOAST_NOTIFICATIONS),
-            "PREFIX": cls.PREFIX,
-            "QUEUE_COMMAND": cls.QUEUE_COMMAND,
-            "VOLUME": cls.VOLUME,
-            "THEME": cls.THEME,
-            "ALLOW_URLS": str(cls.ALLOW_URLS),
-            "REQUIRE_MEMBERSHIP": str(cls.REQUIRE_MEMBERSHIP),
-            "REQUIRE_SUPERCHAT": str(cls.REQUIRE_SUPERCHAT),
-            "MINIMUM_SUPERCHAT": cls.MINIMUM_SUPERCHAT,
-            "ENFORCE_ID_WHITELIST": str(cls.ENFORCE_ID_WHITELIST),
-            "ENFORCE_USER_WHITELIST": str(cls.ENFORCE_USER_WHITELIST),
-            "AUTOREMOVE_SONGS": str(cls.AUTOREMOVE_SONGS),
-            "AUTOBAN_USERS": str(cls.AUTOBAN_USERS),
-            "SONG_FINISH_NOTIFICATIONS": str(cls.SONG_FINISH_NOTIFICATIONS),
-            "IGNORED_VERSION": cls.IGNORED_VERSION,
-        }
-
+        """Convert settings to the dictionary written to config.json (keys in _FIELD_PARSERS order)."""
+        return {key: getattr(cls, key) for key in cls._FIELD_PARSERS}